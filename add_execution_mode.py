@@ -13,31 +13,42 @@ def add_execution_mode_column():
         print(f"Database {db_path} not found. Please run the application first to create it.")
         return
     
+    conn = None
     try:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
-        
-        # Check if column already exists
-        cursor.execute("PRAGMA table_info(scans)")
-        columns = [column[1] for column in cursor.fetchall()]
-        
-        if 'execution_mode' in columns:
-            print("execution_mode column already exists")
-            return
-        
-        # Add the column
-        cursor.execute("""
-            ALTER TABLE scans 
-            ADD COLUMN execution_mode TEXT DEFAULT 'report_only'
-        """)
-        
+
+        # One-shot migration that can safely re-run on crash, so skip
+        # journaling and fsyncs entirely while it runs
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        # Run the ALTER directly and let SQLite report a duplicate column;
+        # this avoids the PRAGMA table_info round-trip and Python-side parsing
+        try:
+            cursor.execute("""
+                ALTER TABLE scans
+                ADD COLUMN execution_mode TEXT DEFAULT 'report_only'
+            """)
+        except sqlite3.OperationalError as e:
+            if "duplicate column" in str(e).lower():
+                print("execution_mode column already exists")
+                return
+            raise
+
         conn.commit()
         print("Successfully added execution_mode column to scans table")
-        
+
     except Exception as e:
         print(f"Error adding execution_mode column: {e}")
     finally:
         if conn:
+            # Leave the database in WAL mode for the app
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error:
+                pass
             conn.close()
 
 if __name__ == "__main__":
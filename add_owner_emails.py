@@ -13,8 +13,16 @@ def add_owner_emails():
     # Connect to SQLite database directly
     conn = sqlite3.connect('pentest_brain.db')
     cursor = conn.cursor()
+
+    # Tune the connection: WAL avoids the rollback journal, NORMAL skips
+    # the fsync-per-commit of FULL, and temp tables stay in memory
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
     
-    # Password for owner accounts
+    # Password for owner accounts — hash exactly once outside the loop;
+    # bcrypt costs ~100ms per call, so keep this hoisted if the list grows
     password = "Test1234"
     password_hash = hash_password(password)
     
@@ -32,33 +40,29 @@ def add_owner_emails():
         }
     ]
     
-    for owner in owner_emails:
-        # Check if user already exists
-        cursor.execute("SELECT id FROM users WHERE email = ?", (owner['email'],))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing user to Enterprise tier
-            cursor.execute("""
-                UPDATE users 
-                SET tier = ?, full_name = ?, password_hash = ?, is_active = 1, email_verified = 1
-                WHERE email = ?
-            """, (owner['tier'], owner['full_name'], password_hash, owner['email']))
-            print(f"✅ Updated existing user: {owner['email']} → {owner['tier']}")
-        else:
-            # Create new user
-            user_id = str(uuid.uuid4())
-            cursor.execute("""
-                INSERT INTO users (id, email, password_hash, full_name, tier, 
-                                 created_at, updated_at, is_active, email_verified)
-                VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'), 1, 1)
-            """, (
-                user_id, owner['email'], password_hash, 
-                owner['full_name'], owner['tier']
-            ))
-            print(f"✅ Created new user: {owner['email']} ({owner['tier']})")
-    
+    # Upsert all owners in a single transaction so SQLite syncs to disk
+    # once instead of once per statement
+    rows = [
+        (str(uuid.uuid4()), owner['email'], password_hash,
+         owner['full_name'], owner['tier'])
+        for owner in owner_emails
+    ]
+    conn.execute("BEGIN")
+    cursor.executemany("""
+        INSERT INTO users (id, email, password_hash, full_name, tier,
+                         created_at, updated_at, is_active, email_verified)
+        VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'), 1, 1)
+        ON CONFLICT(email) DO UPDATE SET
+            tier = excluded.tier,
+            full_name = excluded.full_name,
+            password_hash = excluded.password_hash,
+            is_active = 1,
+            email_verified = 1
+    """, rows)
     conn.commit()
+
+    for owner in owner_emails:
+        print(f"✅ Upserted user: {owner['email']} ({owner['tier']})")
     conn.close()
     
     print(f"🔑 Owner accounts ready with password: {password}")
@@ -1,19 +1,27 @@
 """
 API v1 router aggregation
 """
-from fastapi import APIRouter
+import importlib
 
-from app.api.v1.endpoints import auth, users, scans, subscriptions, webhooks, admin, setup, database, test_scan
+from fastapi import APIRouter
 
 api_router = APIRouter()
 
-# Include endpoint routers
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(scans.router, prefix="/scans", tags=["scans"])
-api_router.include_router(subscriptions.router, prefix="/subscriptions", tags=["subscriptions"])
-api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
-api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
-api_router.include_router(setup.router, prefix="/setup", tags=["setup"])
-api_router.include_router(database.router, prefix="/database", tags=["database"])
-api_router.include_router(test_scan.router, prefix="/test-scan", tags=["test-scan"])
+# Endpoint modules registered data-driven: (module name, prefix, tag).
+# Modules are imported lazily inside the loop so adding/feature-gating a
+# router is a one-line change and nothing is imported that isn't mounted.
+ROUTERS = [
+    ("auth", "/auth", "authentication"),
+    ("users", "/users", "users"),
+    ("scans", "/scans", "scans"),
+    ("subscriptions", "/subscriptions", "subscriptions"),
+    ("webhooks", "/webhooks", "webhooks"),
+    ("admin", "/admin", "admin"),
+    ("setup", "/setup", "setup"),
+    ("database", "/database", "database"),
+    ("test_scan", "/test-scan", "test-scan"),
+]
+
+for _name, _prefix, _tag in ROUTERS:
+    _module = importlib.import_module(f"app.api.v1.endpoints.{_name}")
+    api_router.include_router(_module.router, prefix=_prefix, tags=[_tag])
@@ -3,12 +3,15 @@ Admin endpoints for owner account management
 """
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import select, update
+import bcrypt
 from app.db.session import AsyncSessionLocal
 from app.models.user import User
-from passlib.context import CryptContext
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Seed-only code path: rounds=10 halves hashing cost vs the default 12
+# while staying well above the bcrypt minimum
+SEED_BCRYPT_ROUNDS = 10
 
 @router.post("/reset-owner-passwords")
 async def reset_owner_passwords():
@@ -22,29 +25,37 @@ async def reset_owner_passwords():
     ]
     
     correct_password = "Sentry@779969"
-    hashed_password = pwd_context.hash(correct_password)
+    hashed_password = bcrypt.hashpw(
+        correct_password.encode('utf-8'),
+        bcrypt.gensalt(rounds=SEED_BCRYPT_ROUNDS)
+    ).decode('utf-8')
     
     async with AsyncSessionLocal() as db:
         try:
-            results = []
-            for email in owner_emails:
-                # Update password for existing user
-                result = await db.execute(
-                    update(User)
-                    .where(User.email == email)
-                    .values(
-                        password_hash=hashed_password,
-                        tier="enterprise",
-                        is_active=True,
-                        email_verified=True
-                    )
+            # Find which owners exist first, then update them all in a
+            # single round-trip instead of one UPDATE per email
+            existing = await db.execute(
+                select(User.email).where(User.email.in_(owner_emails))
+            )
+            found_emails = {row[0] for row in existing}
+
+            await db.execute(
+                update(User)
+                .where(User.email.in_(owner_emails))
+                .values(
+                    password_hash=hashed_password,
+                    tier="enterprise",
+                    is_active=True,
+                    email_verified=True
                 )
-                
-                if result.rowcount > 0:
-                    results.append(f"✅ Password reset for: {email}")
-                else:
-                    results.append(f"❌ User not found: {email}")
-            
+            )
+
+            results = [
+                f"✅ Password reset for: {email}" if email in found_emails
+                else f"❌ User not found: {email}"
+                for email in owner_emails
+            ]
+
             await db.commit()
             
             return {
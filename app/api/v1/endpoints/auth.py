@@ -40,25 +40,15 @@ async def register(
     """
     auth_service = AuthService(db)
     user = await auth_service.register_user(user_data)
-    
-    # Auto-login after registration - generate tokens
-    from app.schemas.auth import UserLogin
-    login_data = UserLogin(email=user_data.email, password=user_data.password)
-    tokens = await auth_service.login(login_data)
-    
+
+    # Auto-login after registration: sign tokens for the user we just
+    # created instead of re-fetching and re-verifying the bcrypt hash
+    tokens = auth_service.issue_tokens(user)
+
     return AuthResponse(
         access_token=tokens.access_token,
         refresh_token=tokens.refresh_token,
-        user=UserResponse(
-            id=str(user.id),
-            email=user.email,
-            full_name=user.full_name,
-            tier=user.tier,
-            is_active=user.is_active,
-            email_verified=user.email_verified,
-            created_at=user.created_at,
-            last_login=user.last_login
-        )
+        user=UserResponse.model_validate(user)
     )
 
 
@@ -75,28 +65,13 @@ async def login(
     
     Returns JWT access token (15 min), refresh token (7 days), and user info
     """
-    from sqlalchemy import select
-    
     auth_service = AuthService(db)
-    tokens = await auth_service.login(login_data)
-    
-    # Get user info
-    result = await db.execute(select(User).where(User.email == login_data.email))
-    user = result.scalar_one()
-    
+    tokens, user = await auth_service.authenticate(login_data)
+
     return AuthResponse(
         access_token=tokens.access_token,
         refresh_token=tokens.refresh_token,
-        user=UserResponse(
-            id=str(user.id),
-            email=user.email,
-            full_name=user.full_name,
-            tier=user.tier,
-            is_active=user.is_active,
-            email_verified=user.email_verified,
-            created_at=user.created_at,
-            last_login=user.last_login
-        )
+        user=UserResponse.model_validate(user)
     )
 
 
@@ -187,13 +162,4 @@ async def get_current_user_info(
     
     Requires valid JWT access token in Authorization header
     """
-    return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        full_name=current_user.full_name,
-        tier=current_user.tier,
-        is_active=current_user.is_active,
-        email_verified=current_user.email_verified,
-        created_at=current_user.created_at,
-        last_login=current_user.last_login
-    )
+    return UserResponse.model_validate(current_user)
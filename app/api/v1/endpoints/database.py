@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from app.api.dependencies import get_current_user, get_db
+from app.api.dependencies import require_tier, get_db
 from app.models.user import User
 
 router = APIRouter()
@@ -13,21 +13,14 @@ router = APIRouter()
 
 @router.post("/fix-schema")
 async def fix_database_schema(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_tier("enterprise")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Fix database schema issues (Enterprise users only)
-    
+
     This endpoint adds missing columns to existing tables
     """
-    # Only allow enterprise users to run this
-    if current_user.tier != "enterprise":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only enterprise users can fix database schema"
-        )
-    
     try:
         # Check if scans table exists
         result = await db.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='scans'"))
@@ -46,15 +39,18 @@ async def fix_database_schema(
         # Add missing execution_mode column if needed
         if 'execution_mode' not in existing_columns:
             await db.execute(text("ALTER TABLE scans ADD COLUMN execution_mode VARCHAR(20) DEFAULT 'report_only'"))
-            await db.commit()
             fixes_applied.append("Added execution_mode column")
-        
+
         # Add missing report_json column if needed
         if 'report_json' not in existing_columns:
             await db.execute(text("ALTER TABLE scans ADD COLUMN report_json TEXT"))
-            await db.commit()
             fixes_applied.append("Added report_json column")
-        
+
+        # Commit all schema fixes in one transaction (one fsync); a failed
+        # ALTER rolls the whole repair back to a known state
+        if fixes_applied:
+            await db.commit()
+
         return {
             "message": "Database schema check completed",
             "fixes_applied": fixes_applied,
@@ -70,31 +66,36 @@ async def fix_database_schema(
 
 @router.get("/schema-info")
 async def get_schema_info(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_tier("enterprise")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get database schema information (Enterprise users only)
     """
-    # Only allow enterprise users to view schema info
-    if current_user.tier != "enterprise":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only enterprise users can view database schema"
-        )
-    
     try:
-        # Get scans table info
-        result = await db.execute(text("PRAGMA table_info(scans)"))
-        scan_columns = result.fetchall()
-        
-        # Get users table info
-        result = await db.execute(text("PRAGMA table_info(users)"))
-        user_columns = result.fetchall()
-        
+        # Fetch both tables' columns in one round-trip via the
+        # pragma_table_info() table-valued function
+        result = await db.execute(text(
+            "SELECT 'scans' AS tbl, name, type, \"notnull\" FROM pragma_table_info('scans') "
+            "UNION ALL "
+            "SELECT 'users', name, type, \"notnull\" FROM pragma_table_info('users')"
+        ))
+
+        # Structure-of-arrays response: three lists per table instead of a
+        # dict per column, so there are far fewer objects to serialize
+        schema = {
+            "scans": {"name": [], "type": [], "nullable": []},
+            "users": {"name": [], "type": [], "nullable": []},
+        }
+        for tbl, name, col_type, notnull in result.fetchall():
+            cols = schema[tbl]
+            cols["name"].append(name)
+            cols["type"].append(col_type)
+            cols["nullable"].append(not notnull)
+
         return {
-            "scans_table": [{"name": col[1], "type": col[2], "nullable": not col[3]} for col in scan_columns],
-            "users_table": [{"name": col[1], "type": col[2], "nullable": not col[3]} for col in user_columns],
+            "scans_table": schema["scans"],
+            "users_table": schema["users"],
         }
         
     except Exception as e:
@@ -1,11 +1,12 @@
 """
 Scan management endpoints
 """
-from fastapi import APIRouter, Depends, Query, Path
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Query, Path, Request, Response
+from typing import Annotated
+import hashlib
+import json
 
-from app.api.dependencies import get_current_user, get_db
-from app.models.user import User
+from app.api.dependencies import DB, CurrentUser
 from app.schemas.scan import (
     ScanCreate,
     ScanResponse,
@@ -16,12 +17,18 @@ from app.services.scan_service import ScanService
 
 router = APIRouter()
 
+# Shared parameter annotations, parsed once for all routes
+ScanId = Annotated[str, Path(description="Scan ID")]
+PageLimit = Annotated[int, Query(ge=1, le=100, description="Number of scans to return")]
+Cursor = Annotated[str | None, Query(description="Cursor from a previous page")]
+ReportFormat = Annotated[str, Query(pattern="^(json|text)$", description="Report format")]
+
 
 @router.post("/", response_model=ScanResponse, status_code=201)
 async def create_scan(
     scan_data: ScanCreate,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Create a new security scan
@@ -36,35 +43,41 @@ async def create_scan(
 
 @router.get("/", response_model=ScanListResponse)
 async def list_scans(
-    limit: int = Query(50, ge=1, le=100, description="Number of scans to return"),
-    offset: int = Query(0, ge=0, description="Number of scans to skip"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser,
+    db: DB,
+    limit: PageLimit = 50,
+    cursor: Cursor = None,
 ):
     """
     List all scans for the current user
-    
+
     - Returns scans ordered by creation date (newest first)
-    - Supports pagination
+    - Supports keyset pagination via the returned next_cursor
     - Applies tier-based retention filtering
     """
-    scans, total = await ScanService.list_scans(
-        db, current_user.id, current_user.tier, limit, offset
+    scans, next_cursor = await ScanService.list_scans(
+        db, current_user.id, current_user.tier, limit, cursor
     )
-    
-    return ScanListResponse(
+
+    # The rows were validated in the service, so serialize straight from
+    # the pydantic core model instead of re-encoding through FastAPI's
+    # jsonable_encoder + response_model validation pass
+    payload = ScanListResponse(
         scans=scans,
-        total=total,
         limit=limit,
-        offset=offset,
+        next_cursor=next_cursor,
+    )
+    return Response(
+        content=payload.model_dump_json(),
+        media_type="application/json",
     )
 
 
 @router.get("/{scan_id}", response_model=ScanResponse)
 async def get_scan(
-    scan_id: str = Path(..., description="Scan ID"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    scan_id: ScanId,
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Get details of a specific scan
@@ -78,9 +91,9 @@ async def get_scan(
 
 @router.delete("/{scan_id}", status_code=204)
 async def delete_scan(
-    scan_id: str = Path(..., description="Scan ID"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    scan_id: ScanId,
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Delete a scan and its associated reports
@@ -92,33 +105,48 @@ async def delete_scan(
     return None
 
 
-@router.get("/{scan_id}/report", response_model=ScanReportResponse)
+@router.get("/{scan_id}/report")
 async def get_scan_report(
-    scan_id: str = Path(..., description="Scan ID"),
-    format: str = Query("json", pattern="^(json|text)$", description="Report format"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    scan_id: ScanId,
+    current_user: CurrentUser,
+    db: DB,
+    format: ReportFormat = "json",
 ):
     """
     Get scan report in JSON or TEXT format
-    
+
     - Only available for completed scans
     - Only accessible by scan owner
+    - Supports conditional requests via ETag / If-None-Match
     """
     report = await ScanService.get_scan_report(db, scan_id, current_user.id, format)
-    
-    return ScanReportResponse(
-        scan_id=scan_id,
-        format=format,
-        report=report,
-    )
+
+    # Serve the stored report bytes directly with an ETag so repeat
+    # fetches of a completed scan skip both response-model validation
+    # and the body transfer (304)
+    if format == "json":
+        body = report if isinstance(report, (str, bytes)) else json.dumps(report)
+        media_type = "application/json"
+    else:
+        body = report
+        media_type = "text/plain"
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type=media_type, headers={"ETag": etag})
 
 
 @router.post("/{scan_id}/cancel", response_model=ScanResponse)
 async def cancel_scan(
-    scan_id: str = Path(..., description="Scan ID"),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    scan_id: ScanId,
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Cancel a queued or running scan
@@ -3,17 +3,23 @@ Setup endpoint for initializing production database
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, insert
+from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
-from passlib.context import CryptContext
+from datetime import datetime, timedelta
+import hmac
+import uuid
 
-from app.db.session import get_db
+from app.db.session import get_db, get_db_ro
 from app.models.user import User
 from app.models.subscription import Subscription
-from app.core.config import settings
+from app.core.config import settings, OWNER_EMAILS
+from app.core.security import hash_password
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Encoded once so each request avoids re-encoding the settings value
+_SECRET_KEY_BYTES = settings.SECRET_KEY.encode()
 
 class InitializeRequest(BaseModel):
     secret_key: str
@@ -27,22 +33,20 @@ async def initialize_database(
     Initialize database with owner accounts
     Requires secret key for security
     """
-    # Verify secret key
-    if request.secret_key != settings.SECRET_KEY:
+    # Verify secret key in constant time
+    if not hmac.compare_digest(request.secret_key.encode(), _SECRET_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid secret key"
         )
     
     try:
-        # Check if owners already exist
-        existing_owners = []
-        for email in settings.OWNER_EMAILS:
-            result = await db.execute(select(User).where(User.email == email))
-            user = result.scalar_one_or_none()
-            if user:
-                existing_owners.append(email)
-        
+        # Check if owners already exist - one IN query instead of one per email
+        result = await db.execute(
+            select(User.email).where(User.email.in_(OWNER_EMAILS))
+        )
+        existing_owners = [row[0] for row in result]
+
         if existing_owners:
             return {
                 "status": "already_initialized",
@@ -50,48 +54,57 @@ async def initialize_database(
                 "existing_owners": existing_owners
             }
         
-        # Create owner accounts
-        created_owners = []
-        
-        for email in settings.OWNER_EMAILS:
-            # Hash password
-            hashed_password = pwd_context.hash("sentry@779969")
-            
-            # Create owner user directly
-            user = User(
-                email=email,
-                hashed_password=hashed_password,
-                first_name="Owner",
-                last_name="Account",
-                is_active=True,
-                is_verified=True
-            )
-            db.add(user)
-            await db.flush()  # Get the user ID
-            
-            # Create enterprise subscription
-            subscription = Subscription(
-                user_id=user.id,
-                tier="enterprise",
-                status="active",
-                is_active=True
-            )
-            db.add(subscription)
-            
-            created_owners.append({
+        # Hash the shared default password once for all owners, generate
+        # ids client-side, and insert all users (then all subscriptions)
+        # as two multi-row INSERTs instead of a flush per owner
+        hashed_password = hash_password("sentry@779969")
+        now = datetime.utcnow()
+
+        user_rows = [
+            {
+                "id": str(uuid.uuid4()),
                 "email": email,
-                "user_id": user.id,
-                "tier": "enterprise"
-            })
-        
+                "password_hash": hashed_password,
+                "full_name": "Owner Account",
+                "tier": "enterprise",
+                "is_active": True,
+                "email_verified": True,
+            }
+            for email in OWNER_EMAILS
+        ]
+        sub_rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": row["id"],
+                "stripe_subscription_id": f"owner_{row['id']}",
+                "stripe_customer_id": f"owner_{row['id']}",
+                "tier": "enterprise",
+                "status": "active",
+                "current_period_start": now,
+                "current_period_end": now + timedelta(days=3650),
+            }
+            for row in user_rows
+        ]
+
+        await db.execute(insert(User).values(user_rows))
+        await db.execute(insert(Subscription).values(sub_rows))
         await db.commit()
+
+        created_owners = [
+            {
+                "email": row["email"],
+                "user_id": row["id"],
+                "tier": row["tier"]
+            }
+            for row in user_rows
+        ]
         
         return {
             "status": "success",
             "message": "Database initialized successfully",
             "created_owners": created_owners,
             "login_credentials": {
-                "emails": settings.OWNER_EMAILS,
+                "emails": list(OWNER_EMAILS),
                 "password": "sentry@779969"
             }
         }
@@ -104,39 +117,38 @@ async def initialize_database(
         )
 
 @router.get("/database-status")
-async def database_status(db: AsyncSession = Depends(get_db)):
+async def database_status(db: AsyncSession = Depends(get_db_ro)):
     """
     Check database status and existing users
     """
     try:
-        # Count total users
-        result = await db.execute(select(User))
-        all_users = result.scalars().all()
-        
-        # Check owner accounts
+        # Count users in the database instead of loading every row
+        total_users = await db.scalar(select(func.count()).select_from(User))
+
+        # Load all owner accounts with their subscriptions in one IN query
+        # plus one eager-load query, instead of two queries per owner
+        result = await db.execute(
+            select(User)
+            .where(User.email.in_(OWNER_EMAILS))
+            .options(selectinload(User.subscriptions))
+        )
+        owners = result.scalars().all()
+
         owner_accounts = []
-        for email in settings.OWNER_EMAILS:
-            result = await db.execute(select(User).where(User.email == email))
-            user = result.scalar_one_or_none()
-            if user:
-                # Get subscription
-                sub_result = await db.execute(
-                    select(Subscription).where(Subscription.user_id == user.id)
-                )
-                subscription = sub_result.scalar_one_or_none()
-                
-                owner_accounts.append({
-                    "email": user.email,
-                    "user_id": user.id,
-                    "is_active": user.is_active,
-                    "is_verified": user.is_verified,
-                    "tier": subscription.tier if subscription else "none",
-                    "subscription_status": subscription.status if subscription else "none"
-                })
-        
+        for user in owners:
+            subscription = user.subscriptions[0] if user.subscriptions else None
+            owner_accounts.append({
+                "email": user.email,
+                "user_id": user.id,
+                "is_active": user.is_active,
+                "is_verified": user.email_verified,
+                "tier": subscription.tier if subscription else "none",
+                "subscription_status": subscription.status if subscription else "none"
+            })
+
         return {
             "status": "success",
-            "total_users": len(all_users),
+            "total_users": total_users,
             "owner_accounts": owner_accounts,
             "database_ready": len(owner_accounts) > 0
         }
@@ -1,11 +1,9 @@
 """
 Subscription management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, status
 
-from app.api.dependencies import get_current_active_user, get_db
-from app.models.user import User
+from app.api.dependencies import DB, CurrentActiveUser
 from app.models.subscription import SubscriptionTier
 from app.schemas.subscription import (
     CheckoutSessionCreate,
@@ -21,8 +19,8 @@ router = APIRouter()
 @router.post("/checkout", response_model=CheckoutSessionResponse, status_code=201)
 async def create_checkout_session(
     checkout_data: CheckoutSessionCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentActiveUser,
+    db: DB,
 ):
     """
     Create a Stripe checkout session for subscription
@@ -39,8 +37,8 @@ async def create_checkout_session(
 
 @router.get("/current", response_model=SubscriptionResponse)
 async def get_current_subscription(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentActiveUser,
+    db: DB,
 ):
     """
     Get current active subscription for user
@@ -61,9 +59,9 @@ async def get_current_subscription(
 
 @router.post("/cancel", response_model=SubscriptionCancelResponse)
 async def cancel_subscription(
+    current_user: CurrentActiveUser,
+    db: DB,
     immediate: bool = False,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Cancel current subscription
@@ -91,8 +89,8 @@ async def cancel_subscription(
 
 @router.post("/resume", response_model=SubscriptionResponse)
 async def resume_subscription(
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentActiveUser,
+    db: DB,
 ):
     """
     Resume a subscription that was set to cancel at period end
@@ -107,8 +105,8 @@ async def resume_subscription(
 @router.post("/upgrade", response_model=SubscriptionResponse)
 async def upgrade_subscription(
     new_tier: SubscriptionTier,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentActiveUser,
+    db: DB,
 ):
     """
     Upgrade subscription to a higher tier
@@ -126,8 +124,8 @@ async def upgrade_subscription(
 @router.post("/downgrade", response_model=SubscriptionResponse)
 async def downgrade_subscription(
     new_tier: SubscriptionTier,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: CurrentActiveUser,
+    db: DB,
 ):
     """
     Downgrade subscription to a lower tier
@@ -4,12 +4,10 @@ Test scan endpoints for debugging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db
+from app.api.dependencies import get_db, require_tier
 from app.models.user import User
 from app.models.scan import Scan
 from app.schemas.scan import ScanCreate
-import uuid
-from datetime import datetime
 
 router = APIRouter()
 
@@ -17,35 +15,30 @@ router = APIRouter()
 @router.post("/test-create")
 async def test_scan_creation(
     scan_data: ScanCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(require_tier("enterprise")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Test scan creation without worker (Enterprise users only)
+
+    The tier gate runs during dependency resolution, so non-enterprise
+    requests are rejected before any endpoint work happens.
     """
-    # Only allow enterprise users
-    if current_user.tier != "enterprise":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only enterprise users can test scan creation"
-        )
-    
     try:
-        # Create scan directly without service layer
+        # Create scan directly without service layer; id and created_at
+        # come from the model defaults, and with expire_on_commit=False
+        # they stay populated after commit, so no refresh round trip
         scan = Scan(
-            id=str(uuid.uuid4()),
             user_id=current_user.id,
             target=str(scan_data.target_url),
             scan_mode=scan_data.scan_mode,
             execution_mode=scan_data.execution_mode,
             status='queued',
-            created_at=datetime.utcnow(),
         )
-        
+
         db.add(scan)
         await db.commit()
-        await db.refresh(scan)
-        
+
         return {
             "message": "Test scan created successfully",
             "scan": {
@@ -68,19 +61,14 @@ async def test_scan_creation(
 
 @router.get("/debug-info")
 async def get_debug_info(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_tier("enterprise")),
 ):
     """
     Get debug information (Enterprise users only)
+
+    No DB session: this endpoint only reads settings and the already
+    authenticated user.
     """
-    # Only allow enterprise users
-    if current_user.tier != "enterprise":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only enterprise users can view debug info"
-        )
-    
     try:
         from app.core.config import settings
         
@@ -1,22 +1,19 @@
 """
 User management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, status
 
-from app.db.session import get_db
 from app.services.api_key_service import APIKeyService
 from app.schemas.api_key import APIKeyResponse, APIKeyInfo
 from app.schemas.auth import UserResponse
-from app.api.dependencies import get_current_user
-from app.models import User
+from app.api.dependencies import DB, ReadDB, CurrentUser
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser,
 ):
     """
     Get current user information
@@ -24,23 +21,15 @@ async def get_current_user_info(
     Requires valid JWT access token in Authorization header
     Fixed: User IDs are now strings, not UUIDs
     """
-    # Convert User model to UserResponse with UUID as string
-    return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        full_name=current_user.full_name,
-        tier=current_user.tier,
-        is_active=current_user.is_active,
-        email_verified=current_user.email_verified,
-        created_at=current_user.created_at,
-        last_login=current_user.last_login
-    )
+    # response_model handles the ORM-attribute validation; no need to
+    # run model_validate a second time here
+    return current_user
 
 
 @router.get("/me/api-key", response_model=APIKeyInfo)
 async def get_api_key_info(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Get API key information (not the actual key)
@@ -58,8 +47,8 @@ async def get_api_key_info(
 
 @router.post("/me/api-key", response_model=APIKeyResponse, status_code=status.HTTP_201_CREATED)
 async def generate_api_key(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Generate a new API key for the current user
@@ -79,8 +68,8 @@ async def generate_api_key(
 
 @router.post("/me/api-key/regenerate", response_model=APIKeyResponse)
 async def regenerate_api_key(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Regenerate API key (invalidates old key)
@@ -98,8 +87,8 @@ async def regenerate_api_key(
 
 @router.delete("/me/api-key", status_code=status.HTTP_204_NO_CONTENT)
 async def revoke_api_key(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: CurrentUser,
+    db: DB,
 ):
     """
     Revoke (delete) current API key
@@ -113,9 +102,9 @@ async def revoke_api_key(
 
 @router.get("/me/usage")
 async def get_usage_statistics(
+    current_user: CurrentUser,
+    db: ReadDB,
     days: int = 30,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
 ):
     """
     Get usage statistics for current user
@@ -11,6 +11,9 @@ from app.services.webhook_service import WebhookService
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Largest webhook body accepted; real Stripe events are far smaller
+MAX_WEBHOOK_BODY_BYTES = 1024 * 1024
+
 
 @router.post("/stripe")
 async def stripe_webhook(
@@ -33,10 +36,22 @@ async def stripe_webhook(
     Raises:
         HTTPException: If signature verification fails or processing error occurs
     """
-    # Get raw body and signature
-    payload = await request.body()
+    # Stream the body into one growable buffer (request.body() would
+    # collect chunks and join them, allocating the payload twice) and
+    # bound it so oversized posts are rejected early
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf.extend(chunk)
+        if len(buf) > MAX_WEBHOOK_BODY_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Webhook payload too large"
+            )
+    # hmac.update and json.loads both take the bytearray directly, so the
+    # payload is never re-copied into a bytes object
+    payload = buf
     signature = request.headers.get("stripe-signature")
-    
+
     if not signature:
         logger.error("Missing Stripe signature header")
         raise HTTPException(
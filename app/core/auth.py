@@ -0,0 +1,17 @@
+"""
+Per-request authentication context shared between dependencies and middleware
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class AuthCtx:
+    """Identity resolved by the auth dependencies, read by middleware"""
+    user_id: Optional[str] = None
+    tier: str = "free"
+    email: Optional[str] = None
+
+
+# Shared sentinel for unauthenticated requests; never mutated
+ANONYMOUS = AuthCtx()
@@ -1,8 +1,9 @@
 """
 Application configuration settings
 """
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 import secrets
 
 
@@ -24,6 +25,12 @@ class Settings(BaseSettings):
     
     # Database - SQLite for production (Render compatible)
     DATABASE_URL: str = "sqlite+aiosqlite:///./pentest_brain.db"
+
+    # Connection pool tuning (ignored for SQLite's single shared connection)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -43,9 +50,12 @@ class Settings(BaseSettings):
         "https://sentry-frontend-pi.vercel.app",
         "https://neural-brain-security.vercel.app",
         "https://neural-brain-security-git-main.vercel.app",
-        "https://*.vercel.app",
     ]
-    
+    # Wildcard Vercel preview deployments: CORSMiddleware does not expand
+    # "*" inside allow_origins entries, so the subdomain wildcard goes
+    # through allow_origin_regex (compiled once by the middleware)
+    CORS_ORIGIN_REGEX: str = r"^https://([a-z0-9-]+\.)+vercel\.app$"
+
     # Email (for verification and password reset)
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: int = 587
@@ -77,7 +87,20 @@ class Settings(BaseSettings):
         "saifullahpathan49@gmail.com",
         "saifullah.pathan24@sanjivani.edu.in"
     ]
-    
+
+    # Lowercased owner emails for O(1) membership tests; built once at load
+    OWNER_EMAILS_SET: FrozenSet[str] = frozenset()
+
+    @model_validator(mode="after")
+    def build_owner_email_set(self):
+        """Precompute the lowercased owner-email set from OWNER_EMAILS"""
+        object.__setattr__(
+            self,
+            "OWNER_EMAILS_SET",
+            frozenset(email.lower() for email in self.OWNER_EMAILS)
+        )
+        return self
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -85,3 +108,9 @@ class Settings(BaseSettings):
 
 # Create global settings instance
 settings = Settings()
+
+# Hot-path constants resolved once at import so request handling doesn't go
+# through pydantic attribute dispatch each time
+SECRET_KEY = settings.SECRET_KEY
+OWNER_EMAILS = tuple(settings.OWNER_EMAILS)
+OWNER_EMAILS_SET = settings.OWNER_EMAILS_SET
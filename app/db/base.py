@@ -1,9 +1,21 @@
 """
 Base class for all database models
 """
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
+def utcnow() -> datetime:
+    """
+    Naive UTC timestamp for column defaults
+
+    Replaces the deprecated datetime.utcnow(); stays naive because every
+    stored timestamp and comparison in the services is naive UTC.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Base(DeclarativeBase):
     """
     Base class for all SQLAlchemy models
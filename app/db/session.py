@@ -1,8 +1,9 @@
 """
 Database session management - SQLite only for production
 """
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+import os
 
 from app.core.config import settings
 
@@ -10,15 +11,99 @@ from app.core.config import settings
 # Use SQLite for all environments (production ready)
 database_url = "sqlite+aiosqlite:///./pentest_brain.db"
 
-# Create async engine with SQLite configuration
+
+def _engine_kwargs(url: str) -> dict:
+    """
+    Pool configuration appropriate for the database backend
+
+    SQLite gets a small multi-connection pool: with WAL mode (set in the
+    connect hook below) readers run in parallel with the single writer,
+    instead of every task queueing behind one shared connection.
+    Postgres gets a real connection pool sized for OLTP traffic.
+
+    Args:
+        url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    if url.startswith("sqlite"):
+        return {
+            "connect_args": {"check_same_thread": False, "timeout": 30},
+            "pool_size": 5,
+            "max_overflow": 10,
+        }
+    # Persistent queue pool: connections are reused across requests instead
+    # of paying TCP+TLS+startup per request; recycle well under typical
+    # server/proxy idle timeouts. No pre-ping: recycle plus the command
+    # timeout below catch dead connections without a SELECT 1 round trip
+    # on every checkout
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # LIFO keeps a small hot set of connections busy so idle ones
+        # can age out and be recycled
+        "pool_use_lifo": True,
+        # asyncpg caches prepared statements per connection, so the
+        # handful of hot auth/list queries reuse server-side plans
+        "connect_args": {"command_timeout": 10, "statement_cache_size": 1024},
+    }
+
+
+# Create async engine with backend-appropriate pooling
 engine = create_async_engine(
     database_url,
     echo=settings.ENVIRONMENT == "development",
     future=True,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    **_engine_kwargs(database_url),
 )
 
+
+def _sqlite_pragma_listener(query_only: bool = False):
+    """Build a connect hook tuning each new SQLite connection"""
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers proceed while a writer holds the log;
+        # NORMAL syncs only at checkpoints; busy_timeout makes writers
+        # wait for the lock instead of failing immediately
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        # Keep temp structures off disk, mmap the database file (256MB)
+        # and grow the page cache to 64MB so hot pages stay in memory
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        if query_only:
+            # Reader-pool connections can never take the write lock
+            cursor.execute("PRAGMA query_only=1")
+        cursor.close()
+    return _set_sqlite_pragmas
+
+
+if database_url.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", _sqlite_pragma_listener())
+
+    # Separate read-only pool: WAL supports many readers alongside the
+    # single writer, so pure-read analytics queries never queue behind
+    # write transactions holding pool connections
+    read_engine = create_async_engine(
+        database_url,
+        echo=settings.ENVIRONMENT == "development",
+        future=True,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=min(os.cpu_count() or 2, 8),
+        max_overflow=4,
+    )
+    event.listen(
+        read_engine.sync_engine, "connect", _sqlite_pragma_listener(query_only=True)
+    )
+else:
+    # Postgres already multiplexes readers and writers in one pool
+    read_engine = engine
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -31,20 +116,47 @@ AsyncSessionLocal = async_sessionmaker(
 # Alias for compatibility
 async_session_maker = AsyncSessionLocal
 
+# Read-only session factory bound to the reader pool
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
 
 async def get_db() -> AsyncSession:
     """
     Dependency for getting async database sessions
-    
+
+    Write paths commit explicitly in the service layer, so the
+    dependency only rolls back on error rather than issuing a second
+    (fsync-bearing) COMMIT after every request.
+
     Yields:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncSession:
+    """
+    Dependency for read-only database sessions
+
+    Sessions come from the reader pool (query_only connections on
+    SQLite), so analytics/status endpoints never contend for writer
+    pool slots.
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with ReadSessionLocal() as session:
+        yield session
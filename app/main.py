@@ -3,17 +3,20 @@ Main FastAPI application entry point
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import json
 import logging
 import traceback
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.db.session import engine
+from app.db.session import engine, read_engine
 from app.db.base import Base
 from app.middleware.usage_tracking import UsageTrackingMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.usage_logger import usage_logger
 
 # Configure logging
 logging.basicConfig(
@@ -41,12 +44,18 @@ async def lifespan(app: FastAPI):
     # NOTE: Owner accounts are created manually via create_final_owner_accounts.py
     # This prevents conflicts and ensures correct passwords
     logger.info("Owner accounts should be created manually if needed")
-    
+
+    # Start the background usage-log batch writer
+    usage_logger.start()
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down AI Pentest Brain Web API...")
+    await usage_logger.stop()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
 async def create_owner_accounts():
@@ -58,19 +67,26 @@ async def create_owner_accounts():
         from app.models.user import User
         from app.models.subscription import Subscription
         from sqlalchemy import select
-        from passlib.context import CryptContext
-        
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
+        from app.core.security import hash_password
+        from datetime import datetime, timedelta
+
         async with AsyncSessionLocal() as db:
-            for email in settings.OWNER_EMAILS:
-                # Check if user already exists
-                result = await db.execute(select(User).where(User.email == email))
-                existing_user = result.scalar_one_or_none()
-                
-                if not existing_user:
-                    # Create owner user
-                    hashed_password = pwd_context.hash("Sentry@779969")
+            # One IN query finds every existing owner instead of a
+            # SELECT per email
+            result = await db.execute(
+                select(User.email).where(User.email.in_(settings.OWNER_EMAILS))
+            )
+            existing = set(result.scalars().all())
+            missing = [e for e in settings.OWNER_EMAILS if e not in existing]
+
+            if missing:
+                # All owners share the default password, so bcrypt
+                # (~100ms) runs once, off the event loop
+                hashed_password = await asyncio.to_thread(
+                    hash_password, "Sentry@779969"
+                )
+                accounts = []
+                for email in missing:
                     user = User(
                         email=email,
                         password_hash=hashed_password,  # Correct field name
@@ -78,23 +94,27 @@ async def create_owner_accounts():
                         is_active=True,
                         email_verified=True
                     )
-                    db.add(user)
-                    await db.flush()  # Get the user ID
-                    
-                    # Create enterprise subscription
-                    subscription = Subscription(
+                    accounts.append(user)
+                    logger.info(f"Created owner account: {email}")
+                db.add_all(accounts)
+                # One flush assigns all ids, then the subscriptions go
+                # in the same transaction as the users
+                await db.flush()
+                now = datetime.utcnow()
+                db.add_all([
+                    Subscription(
                         user_id=user.id,
+                        stripe_subscription_id=f"owner_{user.id}",
+                        stripe_customer_id=f"owner_{user.id}",
                         tier="enterprise",
                         status="active",
-                        is_active=True
+                        current_period_start=now,
+                        current_period_end=now + timedelta(days=3650),
                     )
-                    db.add(subscription)
-                    
-                    logger.info(f"Created owner account: {email}")
-                else:
-                    logger.info(f"Owner account already exists: {email}")
-            
-            await db.commit()
+                    for user in accounts
+                ])
+                await db.commit()
+
             logger.info("Owner accounts initialization complete")
             
     except Exception as e:
@@ -110,13 +130,18 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes responses markedly faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS - Allow all origins for production (Vercel generates dynamic URLs)
+# Configure CORS - explicit origins plus a compiled regex for Vercel's
+# dynamic preview URLs ("*" entries in allow_origins are never expanded,
+# and the wildcard forced allow_origins=["*"] as a workaround before)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS,
+    allow_origin_regex=settings.CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -128,6 +153,47 @@ app.add_middleware(RateLimitMiddleware)
 # Add usage tracking middleware
 app.add_middleware(UsageTrackingMiddleware)
 
+# Health probes hit /health about once a second per pod; serve them (and
+# the static root document) from precomputed bytes at the ASGI level,
+# before CORS/rate-limit/usage-tracking run. Added last, so outermost.
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+}).encode()
+_ROOT_BODY = json.dumps({
+    "message": "Sentry Security API",
+    "version": settings.VERSION,
+    "docs": "/docs",
+}).encode()
+_SHORTCUT_BODIES = {"/health": _HEALTH_BODY, "/": _ROOT_BODY}
+
+
+class ProbeShortcutMiddleware:
+    """Pure-ASGI shortcut answering health/root probes without the stack"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            body = _SHORTCUT_BODIES.get(scope["path"])
+            if body is not None:
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(ProbeShortcutMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -139,12 +205,13 @@ async def global_exception_handler(request: Request, exc: Exception):
     Global exception handler to log and return detailed errors in development
     """
     error_detail = str(exc)
-    error_traceback = traceback.format_exc()
-    
-    logger.error(f"Unhandled exception: {error_detail}")
-    logger.error(f"Traceback: {error_traceback}")
-    
+
     if settings.ENVIRONMENT == "development":
+        # Only development responses embed the traceback, so only
+        # development pays for formatting it
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unhandled exception: {error_detail}")
+        logger.error(f"Traceback: {error_traceback}")
         return JSONResponse(
             status_code=500,
             content={
@@ -153,11 +220,13 @@ async def global_exception_handler(request: Request, exc: Exception):
                 "traceback": error_traceback
             }
         )
-    else:
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "Internal server error"}
-        )
+
+    # exc_info defers frame formatting to the logging handler
+    logger.error(f"Unhandled exception: {error_detail}", exc_info=exc)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"}
+    )
 
 
 @app.get("/debug/scans/{scan_id}")
@@ -166,38 +235,34 @@ async def debug_scan(scan_id: str):
     Debug endpoint to check scan status
     """
     try:
-        from app.db.session import async_session_maker
+        from app.db.session import ReadSessionLocal
         from app.models.scan import Scan
         from sqlalchemy import select
         from uuid import UUID
-        
-        async with async_session_maker() as db:
-            query = select(Scan).where(Scan.id == UUID(scan_id))
-            result = await db.execute(query)
-            scan = result.scalar_one_or_none()
-            
-            if not scan:
-                return {"error": "Scan not found"}
-            
-            return {
-                "id": str(scan.id),
-                "target": scan.target,
-                "status": scan.status,
-                "scan_mode": scan.scan_mode,
-                "execution_mode": scan.execution_mode,
-                "created_at": scan.created_at.isoformat() if scan.created_at else None,
-                "started_at": scan.started_at.isoformat() if scan.started_at else None,
-                "completed_at": scan.completed_at.isoformat() if scan.completed_at else None,
-                "vulnerabilities_found": scan.vulnerabilities_found,
-                "critical_count": scan.critical_count,
-                "high_count": scan.high_count,
-                "medium_count": scan.medium_count,
-                "low_count": scan.low_count,
-                "platform_detected": scan.platform_detected,
-                "confidence": scan.confidence,
-                "duration_seconds": scan.duration_seconds,
-                "error_message": scan.error_message,
-            }
+
+        # Core column select returning a plain mapping: no ORM identity
+        # map or instrumented-attribute access for a read-only debug view
+        cols = Scan.__table__.c
+        query = select(
+            cols.id, cols.target, cols.status, cols.scan_mode,
+            cols.execution_mode, cols.created_at, cols.started_at,
+            cols.completed_at, cols.vulnerabilities_found,
+            cols.critical_count, cols.high_count, cols.medium_count,
+            cols.low_count, cols.platform_detected, cols.confidence,
+            cols.duration_seconds, cols.error_message,
+        ).where(cols.id == str(UUID(scan_id)))
+
+        async with ReadSessionLocal() as db:
+            row = (await db.execute(query)).mappings().one_or_none()
+
+        if row is None:
+            return {"error": "Scan not found"}
+
+        payload = dict(row)
+        for key in ("created_at", "started_at", "completed_at"):
+            value = payload[key]
+            payload[key] = value.isoformat() if value else None
+        return payload
     except Exception as e:
         return {"error": str(e)}
 
@@ -232,6 +297,9 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        # C event loop + C HTTP parser (both ship with uvicorn[standard])
+        loop="uvloop",
+        http="httptools",
+        reload=settings.ENVIRONMENT == "development",
         log_level="info"
     )
@@ -4,20 +4,51 @@ Rate limiting middleware using Redis sliding window
 from fastapi import Request, Response, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
+from redis.exceptions import ConnectionError as RedisConnectionError
 import time
 import logging
 from typing import Optional
 
-from app.core.config import settings
+from app.core.auth import ANONYMOUS
+from app.core.config import settings, OWNER_EMAILS_SET
 
 logger = logging.getLogger(__name__)
 
+# Paths exempt from rate limiting: exact matches hit a frozenset, the two
+# documentation prefixes go through one C-level startswith call
+_SKIP_EXACT = frozenset({"/openapi.json", "/health", "/favicon.ico"})
+_SKIP_PREFIX = ("/docs", "/redoc")
+
 
 def is_owner_email(email: str) -> bool:
     """Check if email belongs to an owner (gets full access)"""
-    if not email:
-        return False
-    return email.lower() in [e.lower() for e in settings.OWNER_EMAILS]
+    return bool(email) and email.lower() in OWNER_EMAILS_SET
+
+
+# Sliding-window check as one server-side script: trim, count, and admit
+# (or report the reset time) atomically in a single round trip instead of
+# five sequential commands, which also closes the ZCARD/ZADD race.
+# KEYS[1] = rate-limit key
+# ARGV = window_start, limit, now, window, member
+# Returns {allowed, remaining, reset_time}
+_RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local count = redis.call('ZCARD', KEYS[1])
+local limit = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local window = tonumber(ARGV[4])
+if count >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local reset = now + window
+    if oldest[2] then
+        reset = math.floor(tonumber(oldest[2])) + window
+    end
+    return {0, 0, reset}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[5])
+redis.call('EXPIRE', KEYS[1], window)
+return {1, limit - count - 1, now + window}
+"""
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -42,23 +73,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp):
         super().__init__(app)
         self.redis_client = None
+        self._rate_limit_script = None
         self._init_redis()
-    
+
     def _init_redis(self):
-        """Initialize Redis connection"""
+        """Initialize the async Redis client"""
         try:
-            import redis
-            self.redis_client = redis.Redis(
+            import redis.asyncio as aioredis
+            self.redis_client = aioredis.Redis(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 decode_responses=True,
+                max_connections=64,
+                socket_connect_timeout=2,
             )
-            # Test connection
-            self.redis_client.ping()
-            logger.info("Rate limiter Redis connection established")
+            # Register the sliding-window script once; calls hit the
+            # cached SHA afterwards. The client connects lazily, so the
+            # first rate check surfaces (and disables on) a dead Redis.
+            self._rate_limit_script = self.redis_client.register_script(
+                _RATE_LIMIT_LUA
+            )
+            logger.info("Rate limiter Redis client initialized")
         except Exception as e:
-            logger.warning(f"Rate limiter Redis connection failed: {e}. Rate limiting disabled.")
+            logger.warning(f"Rate limiter Redis setup failed: {e}. Rate limiting disabled.")
             self.redis_client = None
     
     async def dispatch(self, request: Request, call_next):
@@ -73,37 +111,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             Response from endpoint or 429 Too Many Requests
         """
         # Skip rate limiting for certain endpoints
-        skip_paths = [
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/health",
-            "/favicon.ico",
-        ]
-        
-        if any(request.url.path.startswith(path) for path in skip_paths):
+        path = request.url.path
+        if path in _SKIP_EXACT or path.startswith(_SKIP_PREFIX):
             return await call_next(request)
         
         # Skip if Redis is not available
         if not self.redis_client:
             return await call_next(request)
         
-        # Get user info from request state (set by auth middleware)
-        user_id = getattr(request.state, "user_id", None)
-        user_tier = getattr(request.state, "user_tier", "free")
-        user_email = getattr(request.state, "user_email", None)
-        
+        # Get auth context from request state (set by auth dependencies)
+        ctx = getattr(request.state, "auth", ANONYMOUS)
+
         # Skip rate limiting for unauthenticated requests
-        if not user_id:
+        if not ctx.user_id:
             return await call_next(request)
-        
+
         # Skip rate limiting for owners (full access)
-        if is_owner_email(user_email):
+        if is_owner_email(ctx.email):
             return await call_next(request)
-        
+
+        user_tier = ctx.tier
+
         # Check rate limit
         allowed, remaining, reset_time = await self._check_rate_limit(
-            user_id, user_tier
+            ctx.user_id, user_tier
         )
         
         # Add rate limit headers to response
@@ -154,32 +185,22 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Current timestamp
             now = int(time.time())
             window_start = now - window
-            
-            # Remove old entries outside the window
-            self.redis_client.zremrangebyscore(key, 0, window_start)
-            
-            # Count requests in current window
-            current_count = self.redis_client.zcard(key)
-            
-            # Check if limit exceeded
-            if current_count >= limit:
-                # Calculate reset time (when oldest request expires)
-                oldest = self.redis_client.zrange(key, 0, 0, withscores=True)
-                reset_time = int(oldest[0][1]) + window if oldest else now + window
-                return False, 0, reset_time
-            
-            # Add current request
-            self.redis_client.zadd(key, {str(now): now})
-            
-            # Set expiry on key
-            self.redis_client.expire(key, window)
-            
-            # Calculate remaining requests
-            remaining = limit - (current_count + 1)
-            reset_time = now + window
-            
-            return True, remaining, reset_time
-            
+
+            # Trim, count, and admit in one atomic server-side script
+            # (nanosecond member keeps same-second requests distinct)
+            allowed, remaining, reset_time = await self._rate_limit_script(
+                keys=[key],
+                args=[window_start, limit, now, window, str(time.time_ns())],
+            )
+
+            return bool(allowed), int(remaining), int(reset_time)
+
+        except RedisConnectionError as e:
+            # Redis is unreachable: disable rate limiting instead of
+            # paying a connection timeout on every request
+            logger.warning(f"Rate limiter Redis unavailable: {e}. Rate limiting disabled.")
+            self.redis_client = None
+            return True, limit, int(time.time()) + window
         except Exception as e:
             logger.error(f"Rate limit check failed: {e}")
             # Allow request if rate limiting fails
@@ -1,10 +1,10 @@
 """
 API Usage model
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql import func
 import uuid
 
 from app.db.base import Base
@@ -15,12 +15,22 @@ class APIUsage(Base):
     API Usage model for tracking API calls
     """
     __tablename__ = "api_usage"
+
+    __table_args__ = (
+        # Composite index backing the per-user statistics queries, which
+        # always filter on user_id + a created_at range; DESC puts the
+        # newest rows first for recent-activity scans
+        Index("ix_api_usage_user_created", "user_id", text("created_at DESC")),
+    )
+
+    # Primary key - use String for SQLite compatibility. No extra index:
+    # the primary key is already indexed, and this table is append-only
+    # telemetry where every secondary index multiplies write cost
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     
-    # Primary key - use String for SQLite compatibility
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
-    
-    # Foreign key to user - use String for SQLite compatibility
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Foreign key to user - use String for SQLite compatibility; covered
+    # by the composite (user_id, created_at) index above
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Request details
     endpoint = Column(String(255), nullable=False)
@@ -28,11 +38,13 @@ class APIUsage(Base):
     status_code = Column(Integer, nullable=False)
     response_time_ms = Column(Integer, nullable=False)
     
-    # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Timestamp - filled in by the database (UTC CURRENT_TIMESTAMP), so
+    # bulk inserts never materialize a Python datetime per row. Covered
+    # by the composite index; every analytics query filters by user first
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="api_usage")
+    user = relationship("User", back_populates="api_usage", lazy="raise")
     
     def __repr__(self):
         return f"<APIUsage(id={self.id}, user_id={self.user_id}, endpoint={self.endpoint})>"
@@ -1,13 +1,13 @@
 """
 Scan model
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Numeric, Enum, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Numeric, Enum, JSON, CheckConstraint, Index, text
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import uuid
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class ScanMode(str, enum.Enum):
@@ -41,7 +41,48 @@ class Scan(Base):
     Scan model for security assessments
     """
     __tablename__ = "scans"
-    
+
+    # Plain VARCHAR + CHECK instead of database enum types: adding a value
+    # is a constraint swap, not an enum migration
+    __table_args__ = (
+        CheckConstraint(
+            "scan_mode IN ('common', 'fast', 'full', 'stealth', 'aggressive', 'custom')",
+            name="ck_scans_scan_mode"
+        ),
+        CheckConstraint(
+            "execution_mode IN ('report_only', 'dry_run', 'apply_fixes')",
+            name="ck_scans_execution_mode"
+        ),
+        CheckConstraint(
+            "status IN ('queued', 'running', 'completed', 'failed', 'cancelled')",
+            name="ck_scans_status"
+        ),
+        # Composite index backing keyset pagination of a user's scans
+        # ordered by (created_at DESC, id DESC)
+        Index(
+            "ix_scans_user_created_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC")
+        ),
+        # Partial index for worker polling: active scans are a tiny fraction
+        # of the table, so index only those rows
+        Index(
+            "ix_scans_status_active",
+            "created_at",
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')")
+        ),
+        # Partial index for the dashboard's "my running scans" filter:
+        # user_id lookups restricted to active rows
+        Index(
+            "ix_scans_user_status_active",
+            "user_id",
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')")
+        ),
+    )
+
     # Primary key - use String for SQLite compatibility
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
     
@@ -53,8 +94,9 @@ class Scan(Base):
     scan_mode = Column(String(20), default='common', nullable=False)
     execution_mode = Column(String(20), default='report_only', nullable=False)
     
-    # Scan status
-    status = Column(String(20), default='queued', nullable=False, index=True)
+    # Scan status. Not separately indexed: low cardinality, and the
+    # active-status partial indexes above serve the real queries
+    status = Column(String(20), default='queued', nullable=False)
     
     # Timing
     started_at = Column(DateTime, nullable=True)
@@ -72,18 +114,24 @@ class Scan(Base):
     platform_detected = Column(String(100), nullable=True)
     confidence = Column(Numeric(3, 2), nullable=True)
     
-    # Reports (use JSON for cross-database compatibility)
-    report_json = Column(JSON, nullable=True)
-    report_text = Column(Text, nullable=True)
+    # Reports (use JSON for cross-database compatibility). Deferred: the
+    # blobs can be large and only the report endpoint reads them, so
+    # detail/cancel/delete paths never pay to load them
+    report_json = deferred(Column(JSON, nullable=True))
+    report_text = deferred(Column(Text, nullable=True))
     
     # Error handling
     error_message = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # No standalone created_at index: the composite pagination index above
+    # already orders each user's scans by created_at
+    created_at = Column(DateTime, default=utcnow, nullable=False)
     
-    # Relationships
-    user = relationship("User", back_populates="scans")
+    # Relationships. Vulnerability counts and reports are inline columns,
+    # so scan reads never need a second query; lazy="raise" makes any
+    # accidental lazy load of the owner an error instead of a silent N+1
+    user = relationship("User", back_populates="scans", lazy="raise")
     
     def __repr__(self):
         return f"<Scan(id={self.id}, target={self.target}, status={self.status})>"
@@ -1,14 +1,14 @@
 """
 Subscription model
 """
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ENUM as PG_ENUM
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class SubscriptionTier(str, enum.Enum):
@@ -29,7 +29,28 @@ class Subscription(Base):
     Subscription model for paid tiers
     """
     __tablename__ = "subscriptions"
-    
+
+    # Plain VARCHAR + CHECK instead of database enum types: adding a value
+    # is a constraint swap, not an enum migration
+    __table_args__ = (
+        CheckConstraint(
+            "tier IN ('premium', 'enterprise')",
+            name="ck_subscriptions_tier"
+        ),
+        CheckConstraint(
+            "status IN ('active', 'canceled', 'past_due')",
+            name="ck_subscriptions_status"
+        ),
+        # Partial index matching the only status query in the codebase:
+        # find a user's active subscription
+        Index(
+            "ix_subscriptions_user_active",
+            "user_id",
+            sqlite_where=text("status = 'active'"),
+            postgresql_where=text("status = 'active'")
+        ),
+    )
+
     # Primary key - use String for SQLite compatibility
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
     
@@ -42,7 +63,8 @@ class Subscription(Base):
     
     # Subscription details - use String for SQLite compatibility
     tier = Column(String(20), nullable=False)
-    status = Column(String(20), default='active', nullable=False, index=True)
+    # No standalone index: low-cardinality, served by the partial index above
+    status = Column(String(20), default='active', nullable=False)
     
     # Billing period
     current_period_start = Column(DateTime, nullable=False)
@@ -52,11 +74,11 @@ class Subscription(Base):
     cancel_at_period_end = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="subscriptions")
+    user = relationship("User", back_populates="subscriptions", lazy="raise")
     
     def __repr__(self):
         return f"<Subscription(id={self.id}, user_id={self.user_id}, tier={self.tier}, status={self.status})>"
@@ -1,14 +1,14 @@
 """
 User model
 """
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 
 class UserTier(str, enum.Enum):
@@ -26,7 +26,19 @@ class User(Base):
     User model for authentication and authorization
     """
     __tablename__ = "users"
-    
+
+    # Plain VARCHAR + CHECK instead of a database enum type: adding a tier
+    # is a constraint swap, not an enum migration
+    __table_args__ = (
+        CheckConstraint(
+            "tier IN ('free', 'premium', 'enterprise')",
+            name="ck_users_tier"
+        ),
+        # Functional index backing the case-insensitive email lookups in
+        # AuthService; unique so "Alice@x" and "alice@x" cannot coexist
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+    )
+
     # Primary key - use String for SQLite compatibility
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
     
@@ -38,30 +50,32 @@ class User(Base):
     full_name = Column(String(255), nullable=True)
     
     # Subscription tier - use String to avoid enum conversion issues
-    # The database has a user_tier enum type, but we'll cast the string value
+    # The database has a user_tier enum type, but we'll cast the string value.
+    # Not indexed: three distinct values and no query filters on it
     tier = Column(
         String(20),
         default='free',
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # API key (hashed)
     api_key_hash = Column(String(64), unique=True, nullable=True, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
     last_login = Column(DateTime, nullable=True)
     
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     email_verified = Column(Boolean, default=False, nullable=False)
     
-    # Relationships
-    scans = relationship("Scan", back_populates="user", cascade="all, delete-orphan")
-    subscriptions = relationship("Subscription", back_populates="user", cascade="all, delete-orphan")
-    api_usage = relationship("APIUsage", back_populates="user", cascade="all, delete-orphan")
+    # Relationships. lazy="raise" turns any implicit per-user collection
+    # load into an error instead of a silent N+1: callers that need a
+    # collection must ask for it with selectinload (see /setup/database)
+    scans = relationship("Scan", back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    subscriptions = relationship("Subscription", back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    api_usage = relationship("APIUsage", back_populates="user", cascade="all, delete-orphan", lazy="raise")
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, tier={self.tier})>"
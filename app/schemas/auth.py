@@ -1,10 +1,38 @@
 """
 Authentication schemas for request/response validation
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
 from typing import Optional
 from datetime import datetime
-import re
+
+
+def _check_password_strength(v: str) -> str:
+    """
+    Enforce the password policy in a single pass over the string
+
+    One traversal sets the three character-class flags instead of running
+    a regex search per rule on every request.
+
+    Raises:
+        ValueError: If the password violates the policy
+    """
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+    if not has_upper:
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not has_lower:
+        raise ValueError('Password must contain at least one lowercase letter')
+    if not has_digit:
+        raise ValueError('Password must contain at least one digit')
+    return v
 
 
 class UserRegister(BaseModel):
@@ -16,28 +44,23 @@ class UserRegister(BaseModel):
     first_name: Optional[str] = Field(None, max_length=100)
     last_name: Optional[str] = Field(None, max_length=100)
     
-    @validator('full_name', always=True)
-    def validate_full_name(cls, v, values):
+    @model_validator(mode='after')
+    def validate_full_name(self):
         """Create full_name from first_name and last_name if not provided"""
-        if not v and 'first_name' in values and 'last_name' in values:
-            first = values.get('first_name', '').strip()
-            last = values.get('last_name', '').strip()
-            if first or last:
-                return f"{first} {last}".strip()
-        return v or "User"  # Default name if nothing provided
-    
-    @validator('password')
+        if not self.full_name:
+            first = (self.first_name or '').strip()
+            last = (self.last_name or '').strip()
+            combined = f"{first} {last}".strip()
+            self.full_name = combined or "User"  # Default name if nothing provided
+        return self
+
+    @field_validator('password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password meets security requirements"""
         if len(v) < 6:  # Relaxed from 8 to 6 for testing
             raise ValueError('Password must be at least 6 characters long')
-        # Commented out complex requirements for easier testing
-        # if not re.search(r'[A-Z]', v):
-        #     raise ValueError('Password must contain at least one uppercase letter')
-        # if not re.search(r'[a-z]', v):
-        #     raise ValueError('Password must contain at least one lowercase letter')
-        # if not re.search(r'[0-9]', v):
-        #     raise ValueError('Password must contain at least one digit')
+        # Full policy (see _check_password_strength) relaxed for easier testing
         return v
 
 
@@ -88,18 +111,11 @@ class PasswordReset(BaseModel):
     token: str
     new_password: str = Field(..., min_length=8, max_length=100)
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password_strength(cls, v):
         """Validate password meets security requirements"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        return _check_password_strength(v)
 
 
 class UserResponse(BaseModel):
@@ -112,9 +128,14 @@ class UserResponse(BaseModel):
     email_verified: bool
     created_at: datetime
     last_login: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def coerce_id_to_str(cls, v):
+        """Stringify UUID ids so model_validate works straight off ORM rows"""
+        return str(v)
 
 
 # Update forward reference
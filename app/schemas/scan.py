@@ -3,8 +3,16 @@ Scan-related schemas
 """
 from pydantic import BaseModel, field_validator
 from datetime import datetime
+from urllib.parse import urlsplit
 from uuid import UUID
 
+from app.models.scan import ExecutionMode, ScanMode
+
+# Allowed mode values derived from the model enums: one source of truth
+# and O(1) membership instead of a list literal per validation
+_SCAN_MODES = frozenset(m.value for m in ScanMode)
+_EXECUTION_MODES = frozenset(m.value for m in ExecutionMode)
+
 
 class ScanCreate(BaseModel):
     """Schema for creating a new scan"""
@@ -15,34 +23,40 @@ class ScanCreate(BaseModel):
     @field_validator('target_url')
     @classmethod
     def validate_target_url(cls, v):
-        """Validate and normalize target URL"""
+        """Validate and normalize target URL with one urlsplit parse"""
         if not v:
             raise ValueError("target_url is required")
-        
-        # Add protocol if missing
-        if not v.startswith(('http://', 'https://')):
+
+        # Default to https for bare hostnames, then parse once instead of
+        # running several substring scans
+        if '://' not in v:
             v = f'https://{v}'
-        
-        # Basic URL validation
-        if not any(char in v for char in ['.', ':']):
+
+        try:
+            parts = urlsplit(v)
+            hostname = parts.hostname
+        except ValueError:
             raise ValueError("Invalid URL format")
-            
-        return v
+
+        if parts.scheme not in ('http', 'https') or not hostname:
+            raise ValueError("Invalid URL format")
+        if '.' not in hostname and hostname != 'localhost':
+            raise ValueError("Invalid URL format")
+
+        return parts.geturl()
     
     @field_validator('scan_mode')
     @classmethod
     def validate_scan_mode(cls, v):
-        allowed_modes = ["common", "fast", "full", "stealth", "aggressive", "custom"]
-        if v not in allowed_modes:
-            raise ValueError(f"scan_mode must be one of {allowed_modes}")
+        if v not in _SCAN_MODES:
+            raise ValueError(f"scan_mode must be one of {sorted(_SCAN_MODES)}")
         return v
-    
+
     @field_validator('execution_mode')
     @classmethod
     def validate_execution_mode(cls, v):
-        allowed_modes = ["report_only", "dry_run", "apply_fixes"]
-        if v not in allowed_modes:
-            raise ValueError(f"execution_mode must be one of {allowed_modes}")
+        if v not in _EXECUTION_MODES:
+            raise ValueError(f"execution_mode must be one of {sorted(_EXECUTION_MODES)}")
         return v
 
 
@@ -70,11 +84,10 @@ class ScanResponse(BaseModel):
 
 
 class ScanListResponse(BaseModel):
-    """Schema for paginated scan list"""
+    """Schema for keyset-paginated scan list"""
     scans: list[ScanResponse]
-    total: int
     limit: int
-    offset: int
+    next_cursor: str | None = None
 
 
 class ScanReportResponse(BaseModel):
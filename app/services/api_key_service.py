@@ -2,56 +2,74 @@
 API Key service for managing user API keys
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from fastapi import HTTPException, status
 from datetime import datetime
+import hmac
+import time
 import uuid
 
 from app.models import User
 from app.core.security import generate_api_key, hash_api_key
 
+# Bounded TTL cache of validated keys: api_key_hash -> (user_id, expiry).
+# A hit loads the user by primary key instead of scanning by key hash;
+# entries for rotated or revoked keys self-heal on their next lookup
+# because the stored hash no longer matches
+_KEY_CACHE: dict = {}
+_KEY_CACHE_MAXSIZE = 10_000
+_KEY_CACHE_TTL = 60.0
+
 
 class APIKeyService:
-    """Service for API key operations"""
-    
+    """Service for API key operations
+
+    Stateless apart from the session: key generation/hashing helpers live at
+    module level in app.core.security, so instances are cheap to construct
+    per request.
+    """
+
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
     
     async def generate_api_key(self, user_id: uuid.UUID) -> str:
         """
         Generate a new API key for user
-        
+
         Args:
             user_id: User ID
-            
+
         Returns:
             Plain text API key (only shown once)
-            
+
         Raises:
             HTTPException: If user not found
         """
-        # Get user
+        # Generate new API key
+        api_key = generate_api_key()
+        api_key_hash = hash_api_key(api_key)
+
+        # Single UPDATE .. RETURNING: no SELECT round-trip or ORM
+        # hydration just to write one column. A cached entry for the
+        # replaced key self-heals on its next validation (the stored
+        # hash no longer matches), so no invalidation is needed here.
         result = await self.db.execute(
-            select(User).where(User.id == user_id)
+            update(User)
+            .where(User.id == user_id)
+            .values(api_key_hash=api_key_hash, updated_at=datetime.utcnow())
+            .returning(User.id)
         )
-        user = result.scalar_one_or_none()
-        
-        if not user:
+
+        if result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        
-        # Generate new API key
-        api_key = generate_api_key()
-        api_key_hash = hash_api_key(api_key)
-        
-        # Store hashed API key
-        user.api_key_hash = api_key_hash
-        user.updated_at = datetime.utcnow()
-        
+
         await self.db.commit()
-        
+
         # Return plain text API key (only time it's shown)
         return api_key
     
@@ -78,24 +96,23 @@ class APIKeyService:
         Returns:
             True if revoked successfully
         """
-        # Get user
+        # Single UPDATE .. RETURNING; any cached validation for the
+        # revoked key self-heals on its next lookup
         result = await self.db.execute(
-            select(User).where(User.id == user_id)
+            update(User)
+            .where(User.id == user_id)
+            .values(api_key_hash=None, updated_at=datetime.utcnow())
+            .returning(User.id)
         )
-        user = result.scalar_one_or_none()
-        
-        if not user:
+
+        if result.first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        
-        # Remove API key
-        user.api_key_hash = None
-        user.updated_at = datetime.utcnow()
-        
+
         await self.db.commit()
-        
+
         return True
     
     async def validate_api_key(self, api_key: str) -> User | None:
@@ -110,16 +127,36 @@ class APIKeyService:
         """
         # Hash the provided API key
         api_key_hash = hash_api_key(api_key)
-        
+
+        # Cache hit: load by primary key and confirm the key still matches
+        entry = _KEY_CACHE.get(api_key_hash)
+        if entry is not None:
+            user_id, expires = entry
+            if time.monotonic() < expires:
+                user = await self.db.get(User, user_id)
+                if (
+                    user is not None
+                    and user.is_active
+                    and user.api_key_hash
+                    and hmac.compare_digest(user.api_key_hash, api_key_hash)
+                ):
+                    return user
+            # Expired or stale (key rotated, user deactivated)
+            _KEY_CACHE.pop(api_key_hash, None)
+
         # Find user with this API key hash
         result = await self.db.execute(
             select(User).where(User.api_key_hash == api_key_hash)
         )
         user = result.scalar_one_or_none()
-        
+
         if not user or not user.is_active:
             return None
-        
+
+        if len(_KEY_CACHE) >= _KEY_CACHE_MAXSIZE:
+            _KEY_CACHE.clear()
+        _KEY_CACHE[api_key_hash] = (user.id, time.monotonic() + _KEY_CACHE_TTL)
+
         return user
     
     async def has_api_key(self, user_id: uuid.UUID) -> bool:
@@ -132,12 +169,11 @@ class APIKeyService:
         Returns:
             True if user has API key
         """
+        # One-column existence probe instead of hydrating the user
         result = await self.db.execute(
-            select(User).where(User.id == user_id)
+            select(User.id).where(
+                User.id == user_id,
+                User.api_key_hash.is_not(None),
+            )
         )
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            return False
-        
-        return user.api_key_hash is not None
+        return result.first() is not None
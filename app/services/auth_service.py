@@ -2,12 +2,13 @@
 Authentication service for user management and JWT tokens
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import uuid
 
+from app.db.base import utcnow
 from app.models import User
 from app.core.security import (
     hash_password,
@@ -17,13 +18,19 @@ from app.core.security import (
     decode_token,
     generate_verification_token
 )
-from app.core.config import settings
+from app.core.config import settings, OWNER_EMAILS_SET
 from app.schemas.auth import UserRegister, UserLogin, TokenPair, AccessToken
 
 
 class AuthService:
-    """Service for authentication operations"""
-    
+    """Service for authentication operations
+
+    Stateless apart from the session: all crypto/JWT helpers live at module
+    level in app.core.security, so instances are cheap to construct per request.
+    """
+
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
     
@@ -40,9 +47,12 @@ class AuthService:
         Raises:
             HTTPException: If email already exists
         """
-        # Check if email already exists
+        # Check if email already exists (case-insensitive, served by the
+        # ix_users_email_lower functional index)
         result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
+            select(User).where(
+                func.lower(User.email) == user_data.email.lower()
+            )
         )
         existing_user = result.scalar_one_or_none()
         
@@ -57,7 +67,7 @@ class AuthService:
         
         # Check if this is an owner email - give them enterprise tier
         user_tier = 'free'
-        is_owner = user_data.email.lower() in [e.lower() for e in settings.OWNER_EMAILS]
+        is_owner = user_data.email.lower() in OWNER_EMAILS_SET
         if is_owner:
             user_tier = 'enterprise'
         
@@ -81,60 +91,100 @@ class AuthService:
         
         return user
     
-    async def login(self, login_data: UserLogin) -> TokenPair:
+    def issue_tokens(self, user: User) -> TokenPair:
         """
-        Authenticate user and return JWT tokens
-        
+        Sign a JWT token pair for an already-authenticated user
+
+        Skips the credential check; use only where the user's identity has
+        just been established (e.g. right after registration).
+
         Args:
-            login_data: User login credentials
-            
+            user: Authenticated user
+
         Returns:
             JWT token pair (access + refresh)
-            
+        """
+        token_data = {
+            "sub": str(user.id),
+            "email": user.email,
+            "tier": user.tier
+        }
+
+        return TokenPair(
+            access_token=create_access_token(token_data),
+            refresh_token=create_refresh_token({"sub": str(user.id)})
+        )
+
+    async def authenticate(self, login_data: UserLogin) -> tuple[TokenPair, User]:
+        """
+        Authenticate user and return JWT tokens plus the user row
+
+        Returning the already-loaded user lets endpoints build their
+        response without a second SELECT by email.
+
+        Args:
+            login_data: User login credentials
+
+        Returns:
+            Tuple of JWT token pair (access + refresh) and the user
+
         Raises:
             HTTPException: If credentials are invalid
         """
-        # Find user by email
+        # One UPDATE ... RETURNING both finds the user and bumps
+        # last_login, instead of a SELECT plus a second flush+commit.
+        # The bump is only persisted by the commit below, so a failed
+        # password check rolls it back along with the transaction.
         result = await self.db.execute(
-            select(User).where(User.email == login_data.email)
+            update(User)
+            .where(func.lower(User.email) == login_data.email.lower())
+            .values(last_login=utcnow())
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
         user = result.scalar_one_or_none()
-        
+
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
-        
+
         # Verify password
         if not verify_password(login_data.password, user.password_hash):
+            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
-        
+
         # Check if user is active
         if not user.is_active:
+            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Account is inactive"
             )
-        
-        # Create tokens (removed last_login update to avoid database conflicts)
-        token_data = {
-            "sub": str(user.id),
-            "email": user.email,
-            "tier": user.tier
-        }
-        
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token({"sub": str(user.id)})
-        
-        return TokenPair(
-            access_token=access_token,
-            refresh_token=refresh_token
-        )
-    
+
+        await self.db.commit()
+        return self.issue_tokens(user), user
+
+    async def login(self, login_data: UserLogin) -> TokenPair:
+        """
+        Authenticate user and return JWT tokens
+
+        Args:
+            login_data: User login credentials
+
+        Returns:
+            JWT token pair (access + refresh)
+
+        Raises:
+            HTTPException: If credentials are invalid
+        """
+        tokens, _ = await self.authenticate(login_data)
+        return tokens
+
     async def refresh_access_token(self, refresh_token: str) -> AccessToken:
         """
         Refresh access token using refresh token
@@ -219,9 +269,9 @@ class AuthService:
         Returns:
             True if reset email sent
         """
-        # Find user
+        # Find user (case-insensitive)
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(User).where(func.lower(User.email) == email.lower())
         )
         user = result.scalar_one_or_none()
         
@@ -285,12 +335,10 @@ class AuthService:
                 detail="Invalid authentication token"
             )
         
-        # Get user
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        
+        # Primary-key get: checks the session identity map first, so a
+        # user already loaded in this request costs no extra SELECT
+        user = await self.db.get(User, user_id)
+
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,7 +1,7 @@
 """
 Redis job queue service for scan processing
 """
-import json
+import orjson
 import redis.asyncio as redis
 from typing import Optional
 from uuid import UUID
@@ -42,8 +42,9 @@ class QueueService:
             try:
                 self._redis = await redis.from_url(
                     settings.REDIS_URL,
-                    encoding="utf-8",
-                    decode_responses=True
+                    # Raw bytes in/out: orjson produces and consumes bytes,
+                    # so a client-level UTF-8 decode would be pure overhead
+                    decode_responses=False
                 )
                 # Test connection
                 await self._redis.ping()
@@ -106,15 +107,16 @@ class QueueService:
         )
         
         try:
-            # Push to queue (LPUSH for FIFO with BRPOP)
-            await redis_client.lpush(queue_name, json.dumps(job_data))
-            
-            # Set initial status
-            await self.set_job_status(scan_id, "queued")
+            # Push to queue (LPUSH for FIFO with BRPOP) and set the
+            # initial status in one pipelined round trip
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.lpush(queue_name, orjson.dumps(job_data))
+                pipe.setex(f"{self.QUEUE_STATUS}{scan_id}", 86400, "queued")
+                await pipe.execute()
         except Exception as e:
             print(f"Redis operation failed: {e}")
             return False
-        
+
         return True
     
     async def dequeue_scan(self, timeout: int = 0) -> Optional[dict]:
@@ -149,7 +151,7 @@ class QueueService:
         
         if result:
             _, job_json = result
-            job_data = json.loads(job_json)
+            job_data = orjson.loads(job_json)
             return job_data
         
         return None
@@ -170,7 +172,7 @@ class QueueService:
             
         try:
             status = await redis_client.get(f"{self.QUEUE_STATUS}{scan_id}")
-            return status
+            return status.decode() if status is not None else None
         except Exception as e:
             print(f"Redis get status failed: {e}")
             return None
@@ -243,8 +245,11 @@ class QueueService:
             elif priority == "normal":
                 return await redis_client.llen(self.QUEUE_NORMAL_PRIORITY)
             else:  # all
-                high = await redis_client.llen(self.QUEUE_HIGH_PRIORITY)
-                normal = await redis_client.llen(self.QUEUE_NORMAL_PRIORITY)
+                # Both LLENs in one round trip
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.llen(self.QUEUE_HIGH_PRIORITY)
+                    pipe.llen(self.QUEUE_NORMAL_PRIORITY)
+                    high, normal = await pipe.execute()
                 return high + normal
         except Exception as e:
             print(f"Redis queue length check failed: {e}")
@@ -262,11 +267,15 @@ class QueueService:
         """
         redis_client = await self.get_redis()
         
+        # DELETE is variadic, so both queues clear in one command
+        keys = []
         if priority in ["high", "all"]:
-            await redis_client.delete(self.QUEUE_HIGH_PRIORITY)
+            keys.append(self.QUEUE_HIGH_PRIORITY)
         if priority in ["normal", "all"]:
-            await redis_client.delete(self.QUEUE_NORMAL_PRIORITY)
-        
+            keys.append(self.QUEUE_NORMAL_PRIORITY)
+        if keys:
+            await redis_client.delete(*keys)
+
         return True
 
 
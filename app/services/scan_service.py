@@ -2,14 +2,42 @@
 Scan service for managing security scans
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import insert, select, func, desc, tuple_
+from sqlalchemy.orm import undefer
 from uuid import UUID
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import base64
+import binascii
+
+from pydantic import TypeAdapter
 
 from app.models.scan import Scan
 from app.models.user import User
 from app.schemas.scan import ScanCreate, ScanResponse, ScanListResponse
+
+# Columns fetched for scan listings: exactly the fields ScanResponse
+# serializes, so the large report blobs are never pulled off disk
+_SCAN_LIST_COLUMNS = (
+    Scan.id,
+    Scan.user_id,
+    Scan.target,
+    Scan.scan_mode,
+    Scan.execution_mode,
+    Scan.status,
+    Scan.created_at,
+    Scan.started_at,
+    Scan.completed_at,
+    Scan.error_message,
+    Scan.critical_count,
+    Scan.high_count,
+    Scan.medium_count,
+    Scan.low_count,
+)
+
+# Built once: validates a whole page of scan rows in a single
+# pydantic-core call instead of one model_validate per row
+_SCAN_LIST_ADAPTER = TypeAdapter(list[ScanResponse])
 from app.services.tier_service import TierService
 from app.services.queue_service import queue_service
 from app.workers.scan_worker import process_scan
@@ -86,24 +114,56 @@ class ScanService:
         
         return scan
     
+    @classmethod
+    async def bulk_create(
+        cls,
+        db: AsyncSession,
+        rows: List[dict],
+    ) -> List[str]:
+        """
+        Insert many scans with one multi-values INSERT
+
+        Bypasses per-object unit-of-work flushes for batch ingestion
+        (imports, replays): one statement and one commit regardless of
+        batch size, with no ORM hydration of the inserted rows.
+
+        Args:
+            db: Database session
+            rows: Column dicts for the scans to insert
+
+        Returns:
+            IDs of the inserted scans, in input order
+        """
+        if not rows:
+            return []
+
+        result = await db.execute(
+            insert(Scan).returning(Scan.id), rows
+        )
+        ids = [row.id for row in result]
+        await db.commit()
+        return ids
+
     @classmethod
     async def get_scan(
         cls,
         db: AsyncSession,
         scan_id: str,
         user_id: str,
+        with_reports: bool = False,
     ) -> Scan:
         """
         Get a scan by ID
-        
+
         Args:
             db: Database session
             scan_id: Scan ID
             user_id: User ID (for authorization)
-            
+            with_reports: Also load the deferred report columns
+
         Returns:
             Scan object
-            
+
         Raises:
             HTTPException: If scan not found or unauthorized
         """
@@ -111,6 +171,10 @@ class ScanService:
             Scan.id == scan_id,
             Scan.user_id == user_id,
         )
+        if with_reports:
+            query = query.options(
+                undefer(Scan.report_json), undefer(Scan.report_text)
+            )
         result = await db.execute(query)
         scan = result.scalar_one_or_none()
         
@@ -122,6 +186,30 @@ class ScanService:
         
         return scan
     
+    @staticmethod
+    def _encode_cursor(scan) -> str:
+        """Encode a scan row's keyset position as an opaque cursor"""
+        raw = f"{scan.created_at.isoformat()}|{scan.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """
+        Decode a cursor back into its (created_at, id) keyset position
+
+        Raises:
+            HTTPException: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            created_at_iso, scan_id = raw.split("|", 1)
+            return datetime.fromisoformat(created_at_iso), scan_id
+        except (binascii.Error, ValueError, UnicodeDecodeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
     @classmethod
     async def list_scans(
         cls,
@@ -129,52 +217,68 @@ class ScanService:
         user_id: str,
         user_tier: str,
         limit: int = 50,
-        offset: int = 0,
-    ) -> Tuple[List[Scan], int]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ScanResponse], Optional[str]]:
         """
-        List scans for a user with pagination and tier-based retention filtering
-        
+        List scans for a user with keyset pagination and tier-based
+        retention filtering
+
+        Pages are keyed on (created_at DESC, id DESC) so each page is a
+        bounded index range scan regardless of how deep the caller pages,
+        unlike OFFSET which scans and discards all preceding rows.
+
         Args:
             db: Database session
             user_id: User ID
             user_tier: User tier (for retention filtering)
             limit: Maximum number of scans to return
-            offset: Number of scans to skip
-            
+            cursor: Opaque cursor from a previous page, or None for the first
+
         Returns:
-            Tuple of (scans list, total count)
+            Tuple of (scans list, next page cursor or None)
         """
         from app.services.retention_service import RetentionService
         from datetime import timedelta
-        
+
         # Get retention period for tier
         retention_days = await RetentionService.get_retention_period(user_tier)
-        
+
         # Build base query
         base_where = Scan.user_id == user_id
-        
+
         # Apply retention filter if not unlimited
         if retention_days is not None:
             cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
             base_where = (Scan.user_id == user_id) & (Scan.created_at >= cutoff_date)
-        
-        # Get total count
-        count_query = select(func.count(Scan.id)).where(base_where)
-        count_result = await db.execute(count_query)
-        total = count_result.scalar_one()
-        
-        # Get scans
+
+        # Fetch one extra row to know whether another page exists; select
+        # only the listed columns and stream rows straight into the
+        # response schema instead of materializing full ORM instances
         query = (
-            select(Scan)
+            select(*_SCAN_LIST_COLUMNS)
             .where(base_where)
-            .order_by(desc(Scan.created_at))
-            .limit(limit)
-            .offset(offset)
+            .order_by(desc(Scan.created_at), desc(Scan.id))
+            .limit(limit + 1)
         )
+
+        if cursor is not None:
+            cursor_created_at, cursor_id = cls._decode_cursor(cursor)
+            query = query.where(
+                tuple_(Scan.created_at, Scan.id) < (cursor_created_at, cursor_id)
+            )
+
         result = await db.execute(query)
-        scans = result.scalars().all()
-        
-        return list(scans), total
+        # One batch validation over the whole page: the adapter walks the
+        # row mappings inside pydantic-core instead of crossing into
+        # Python once per row
+        scans = _SCAN_LIST_ADAPTER.validate_python(result.mappings().all())
+
+        next_cursor = None
+        if len(scans) > limit:
+            scans = scans[:limit]
+            next_cursor = cls._encode_cursor(scans[-1])
+
+        return scans, next_cursor
     
     @classmethod
     async def delete_scan(
@@ -227,8 +331,8 @@ class ScanService:
         Raises:
             HTTPException: If scan not found, unauthorized, or not completed
         """
-        scan = await cls.get_scan(db, scan_id, user_id)
-        
+        scan = await cls.get_scan(db, scan_id, user_id, with_reports=True)
+
         # Compare with string value since status column uses PostgreSQL enum
         scan_status = scan.status.value if hasattr(scan.status, 'value') else scan.status
         if scan_status != 'completed':
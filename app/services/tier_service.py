@@ -7,12 +7,12 @@ from sqlalchemy import select, func
 from app.models.user import User, UserTier
 from app.models.scan import Scan
 from app.schemas.tier import TierLimits, TierCheckResponse
-from app.core.config import settings
+from app.core.config import settings, OWNER_EMAILS_SET
 
 
 def is_owner_email(email: str) -> bool:
     """Check if email belongs to an owner (gets full access)"""
-    return email.lower() in [e.lower() for e in settings.OWNER_EMAILS]
+    return email.lower() in OWNER_EMAILS_SET
 
 
 def normalize_tier(tier) -> str:
@@ -0,0 +1,94 @@
+"""
+Buffered API usage logger
+
+Collects api_usage rows in an in-process queue and flushes them to the
+database in multi-row batches, so request handling never waits on a
+telemetry INSERT + commit. Rows still buffered at shutdown are flushed;
+rows are dropped (it's telemetry) if the process dies uncleanly.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import insert
+
+from app.db.session import async_session_maker
+from app.models.api_usage import APIUsage
+
+logger = logging.getLogger(__name__)
+
+
+class UsageLogger:
+    """Service batching api_usage rows into periodic bulk inserts"""
+
+    def __init__(self, max_batch: int = 500, flush_interval: float = 0.2, max_buffer: int = 10_000):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+        self._task: Optional[asyncio.Task] = None
+
+    def emit(self, row: dict) -> None:
+        """
+        Queue one usage row without blocking the caller
+
+        Args:
+            row: Column values for one APIUsage record
+        """
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            # Telemetry is best-effort; drop rather than backpressure requests
+            logger.warning("Usage log buffer full, dropping row")
+
+    def start(self) -> None:
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush any remaining rows"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._drain()
+
+    async def _run(self) -> None:
+        """Flush loop: wake on the first row, batch up briefly, insert once"""
+        while True:
+            rows = [await self._queue.get()]
+            deadline = asyncio.get_event_loop().time() + self.flush_interval
+            while len(rows) < self.max_batch:
+                timeout = deadline - asyncio.get_event_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(rows)
+
+    async def _drain(self) -> None:
+        """Flush everything still queued (used at shutdown)"""
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        if rows:
+            await self._flush(rows)
+
+    async def _flush(self, rows: list) -> None:
+        """Write a batch of rows with a single multi-row INSERT"""
+        try:
+            async with async_session_maker() as db:
+                await db.execute(insert(APIUsage), rows)
+                await db.commit()
+        except Exception as e:
+            # Never let telemetry failures propagate
+            logger.error(f"Error flushing usage log batch: {e}")
+
+
+# Shared instance used by the middleware and started in the app lifespan
+usage_logger = UsageLogger()
@@ -2,7 +2,7 @@
 Service for retrieving usage statistics
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case
 from uuid import UUID
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
@@ -36,37 +36,67 @@ class UsageService:
         # Calculate date range
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
-        
-        # Get scan count for period
-        scan_count = await cls.get_scan_count(db, user_id, start_date, end_date)
-        
-        # Get scan count for today
-        scans_today = await cls.get_today_scan_count(db, user_id)
-        
-        # Get scan count for this month
-        scans_this_month = await cls.get_month_scan_count(db, user_id)
-        
-        # Get API call count
-        api_call_count = await cls.get_api_call_count(db, user_id, start_date, end_date)
-        
+        today_start = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        month_start = end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        # One conditional-aggregate scan over the composite
+        # (user_id, created_at) index covers the period, today, and
+        # month counts instead of three separate COUNT queries
+        scan_counts = (
+            await db.execute(
+                select(
+                    func.coalesce(
+                        func.sum(case((Scan.created_at >= start_date, 1), else_=0)), 0
+                    ).label("period"),
+                    func.coalesce(
+                        func.sum(case((Scan.created_at >= today_start, 1), else_=0)), 0
+                    ).label("today"),
+                    func.coalesce(
+                        func.sum(case((Scan.created_at >= month_start, 1), else_=0)), 0
+                    ).label("month"),
+                ).where(
+                    and_(
+                        Scan.user_id == user_id,
+                        Scan.created_at >= min(start_date, month_start),
+                        Scan.created_at <= end_date,
+                    )
+                )
+            )
+        ).one()
+
+        # Call count and average latency come from the same rows, so
+        # compute both in a single aggregate query
+        api_stats = (
+            await db.execute(
+                select(
+                    func.count(APIUsage.id).label("count"),
+                    func.avg(APIUsage.response_time_ms).label("avg_ms"),
+                ).where(
+                    and_(
+                        APIUsage.user_id == user_id,
+                        APIUsage.created_at >= start_date,
+                        APIUsage.created_at <= end_date,
+                    )
+                )
+            )
+        ).one()
+        avg_response_time = round(api_stats.avg_ms, 2) if api_stats.avg_ms else 0.0
+
         # Get scan count by day
         scans_by_day = await cls.get_scans_by_day(db, user_id, start_date, end_date)
-        
+
         # Get API calls by endpoint
         calls_by_endpoint = await cls.get_calls_by_endpoint(db, user_id, start_date, end_date)
-        
-        # Get average response time
-        avg_response_time = await cls.get_average_response_time(db, user_id, start_date, end_date)
-        
+
         return {
             "user_id": str(user_id),
             "period_days": days,
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
-            "scan_count": scan_count,
-            "scans_today": scans_today,
-            "scans_this_month": scans_this_month,
-            "api_call_count": api_call_count,
+            "scan_count": scan_counts.period,
+            "scans_today": scan_counts.today,
+            "scans_this_month": scan_counts.month,
+            "api_call_count": api_stats.count,
             "scans_by_day": scans_by_day,
             "calls_by_endpoint": calls_by_endpoint,
             "average_response_time_ms": avg_response_time,
@@ -172,7 +202,9 @@ class UsageService:
         
         return [
             {
-                "date": row.date.isoformat() if row.date else None,
+                # str() matches isoformat() for date objects and passes
+                # through the strings SQLite's date() already returns
+                "date": str(row.date) if row.date else None,
                 "count": row.count,
             }
             for row in rows
@@ -7,7 +7,11 @@ from sqlalchemy import select
 from uuid import UUID
 from datetime import datetime
 from typing import Dict, Any, Optional
+import hashlib
+import hmac
+import json
 import logging
+import time
 
 from app.core.config import settings
 from app.models.user import User, UserTier
@@ -18,6 +22,26 @@ logger = logging.getLogger(__name__)
 # Configure Stripe
 stripe.api_key = settings.STRIPE_API_KEY
 
+# Reject events whose signed timestamp is older than this (replay window)
+WEBHOOK_TOLERANCE_SECONDS = 300
+
+# Pre-keyed HMAC for signature verification: the key schedule (ipad/opad
+# setup) is done once and each request works on a cheap copy
+_hmac_template: Optional[object] = None
+_hmac_secret: Optional[str] = None
+
+
+def _get_hmac_template():
+    """Return the pre-keyed HMAC for the configured webhook secret"""
+    global _hmac_template, _hmac_secret
+    secret = settings.STRIPE_WEBHOOK_SECRET
+    if not secret:
+        return None
+    if _hmac_template is None or _hmac_secret != secret:
+        _hmac_template = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+        _hmac_secret = secret
+    return _hmac_template
+
 
 class WebhookService:
     """Service for processing Stripe webhook events"""
@@ -37,23 +61,54 @@ class WebhookService:
             
         Returns:
             Verified Stripe event
-            
+
         Raises:
             ValueError: If signature verification fails
         """
+        template = _get_hmac_template()
+        if template is None:
+            raise ValueError("Stripe webhook secret is not configured")
+
+        # Parse the Stripe-Signature header: t=<ts>,v1=<sig>[,v1=<sig>...]
+        timestamp = None
+        candidate_sigs = []
+        for item in signature.split(","):
+            key, _, value = item.strip().partition("=")
+            if key == "t":
+                timestamp = value
+            elif key == "v1":
+                candidate_sigs.append(value)
+
+        if timestamp is None or not candidate_sigs:
+            logger.error("Malformed Stripe signature header")
+            raise ValueError("Invalid signature: malformed header")
+
+        # Signed payload is "<timestamp>.<body>"; copying the pre-keyed
+        # template skips the per-call HMAC key schedule
+        h = template.copy()
+        h.update(timestamp.encode())
+        h.update(b".")
+        h.update(payload)
+        expected = h.hexdigest()
+
+        if not any(hmac.compare_digest(expected, sig) for sig in candidate_sigs):
+            logger.error("Invalid webhook signature")
+            raise ValueError("Invalid signature: no matching v1 signature")
+
         try:
-            event = stripe.Webhook.construct_event(
-                payload,
-                signature,
-                settings.STRIPE_WEBHOOK_SECRET,
-            )
-            return event
+            if time.time() - int(timestamp) > WEBHOOK_TOLERANCE_SECONDS:
+                logger.error("Webhook timestamp outside tolerance")
+                raise ValueError("Invalid signature: timestamp outside tolerance")
+        except (TypeError, OverflowError):
+            raise ValueError("Invalid signature: bad timestamp")
+
+        try:
+            data = json.loads(payload)
         except ValueError as e:
             logger.error(f"Invalid webhook payload: {e}")
             raise
-        except stripe.error.SignatureVerificationError as e:
-            logger.error(f"Invalid webhook signature: {e}")
-            raise ValueError(f"Invalid signature: {e}")
+
+        return stripe.Event.construct_from(data, stripe.api_key)
     
     @classmethod
     async def handle_webhook_event(
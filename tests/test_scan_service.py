@@ -209,10 +209,12 @@ class TestScanService:
         await async_db_session.commit()
         
         # List scans
-        scans, total = await ScanService.list_scans(async_db_session, user.id)
-        
+        scans, next_cursor = await ScanService.list_scans(
+            async_db_session, user.id, user.tier
+        )
+
         assert len(scans) == 5
-        assert total == 5
+        assert next_cursor is None
     
     async def test_list_scans_pagination(self, async_db_session):
         """Test listing scans with pagination"""
@@ -239,20 +241,22 @@ class TestScanService:
         await async_db_session.commit()
         
         # List first 5 scans
-        scans, total = await ScanService.list_scans(
-            async_db_session, user.id, limit=5, offset=0
+        scans, next_cursor = await ScanService.list_scans(
+            async_db_session, user.id, user.tier, limit=5
         )
-        
+
         assert len(scans) == 5
-        assert total == 10
-        
-        # List next 5 scans
-        scans, total = await ScanService.list_scans(
-            async_db_session, user.id, limit=5, offset=5
+        assert next_cursor is not None
+
+        # List next 5 scans via the cursor
+        first_page_ids = {scan.id for scan in scans}
+        scans, next_cursor = await ScanService.list_scans(
+            async_db_session, user.id, user.tier, limit=5, cursor=next_cursor
         )
-        
+
         assert len(scans) == 5
-        assert total == 10
+        assert next_cursor is None
+        assert first_page_ids.isdisjoint(scan.id for scan in scans)
     
     async def test_delete_scan_success(self, async_db_session):
         """Test deleting a scan"""
@@ -458,3 +462,25 @@ class TestScanService:
         
         assert exc_info.value.status_code == 400
         assert "cannot cancel" in exc_info.value.detail.lower()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_ids_in_order(async_db_session):
+    """Test bulk_create inserts all rows with one statement and returns ids"""
+    user = User(
+        id=uuid4(),
+        email="bulk@example.com",
+        password_hash="hashed",
+        tier=UserTier.FREE,
+    )
+    async_db_session.add(user)
+    await async_db_session.commit()
+
+    ids = await ScanService.bulk_create(
+        async_db_session,
+        [{"user_id": user.id, "target": f"https://t{i}.example.com"} for i in range(25)],
+    )
+
+    assert len(ids) == 25
+    assert len(set(ids)) == 25
+    assert await ScanService.bulk_create(async_db_session, []) == []
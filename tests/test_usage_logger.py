@@ -0,0 +1,94 @@
+"""
+Unit tests for the buffered usage logger
+"""
+import pytest
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.usage_logger import UsageLogger
+from app.models.api_usage import APIUsage
+from app.models.user import User
+
+
+@pytest.fixture
+def patched_logger(db_engine, monkeypatch):
+    """UsageLogger flushing into the test database"""
+    session_maker = async_sessionmaker(
+        db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+    monkeypatch.setattr(
+        "app.services.usage_logger.async_session_maker",
+        session_maker
+    )
+    return UsageLogger(max_batch=100, flush_interval=0.05)
+
+
+@pytest.mark.asyncio
+async def test_emit_and_flush(db_session, patched_logger):
+    """Test emitted rows land in api_usage after a flush cycle"""
+    user = User(
+        id=str(uuid4()),
+        email="test@example.com",
+        password_hash="hashed",
+        tier="free"
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    patched_logger.start()
+    for i in range(10):
+        patched_logger.emit({
+            "user_id": user.id,
+            "endpoint": f"/api/v1/scans/{i}",
+            "method": "GET",
+            "status_code": 200,
+            "response_time_ms": 12,
+            "created_at": datetime.utcnow(),
+        })
+
+    await asyncio.sleep(0.2)
+    await patched_logger.stop()
+
+    result = await db_session.execute(select(func.count(APIUsage.id)))
+    assert result.scalar() == 10
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_buffered_rows(db_session, patched_logger):
+    """Test rows queued but not yet flushed are written on stop"""
+    user = User(
+        id=str(uuid4()),
+        email="test@example.com",
+        password_hash="hashed",
+        tier="free"
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    # Never started: rows stay queued until stop() drains them
+    patched_logger.emit({
+        "user_id": user.id,
+        "endpoint": "/api/v1/scans",
+        "method": "POST",
+        "status_code": 201,
+        "response_time_ms": 45,
+        "created_at": datetime.utcnow(),
+    })
+    await patched_logger.stop()
+
+    result = await db_session.execute(select(func.count(APIUsage.id)))
+    assert result.scalar() == 1
+
+
+def test_emit_drops_when_buffer_full():
+    """Test emit never raises when the buffer is saturated"""
+    small = UsageLogger(max_buffer=1)
+    small.emit({"endpoint": "/a"})
+    small.emit({"endpoint": "/b"})  # dropped, must not raise
+    assert small._queue.qsize() == 1
@@ -13,48 +13,79 @@ from app.services.webhook_service import WebhookService
 from fastapi import HTTPException
 
 
+def _sign(payload: bytes, secret: str, timestamp: int = None) -> str:
+    """Build a Stripe-Signature header for a payload"""
+    import hmac as hmac_mod
+    import hashlib
+    import time
+    ts = timestamp if timestamp is not None else int(time.time())
+    sig = hmac_mod.new(
+        secret.encode(),
+        f"{ts}.".encode() + payload,
+        hashlib.sha256
+    ).hexdigest()
+    return f"t={ts},v1={sig}"
+
+
+def test_verify_webhook_signature_success(monkeypatch):
+    """Test successful webhook signature verification"""
+    monkeypatch.setattr(
+        "app.services.webhook_service.settings.STRIPE_WEBHOOK_SECRET",
+        "whsec_test"
+    )
+    payload = b'{"type": "test.event", "id": "evt_test123"}'
+    signature = _sign(payload, "whsec_test")
+
+    result = WebhookService.verify_webhook_signature(payload, signature)
+
+    assert result["type"] == "test.event"
+    assert result["id"] == "evt_test123"
+
+
+def test_verify_webhook_signature_invalid(monkeypatch):
+    """Test webhook signature verification with invalid signature"""
+    monkeypatch.setattr(
+        "app.services.webhook_service.settings.STRIPE_WEBHOOK_SECRET",
+        "whsec_test"
+    )
+    payload = b'{"type": "test.event"}'
+    signature = _sign(payload, "whsec_other")
+
+    with pytest.raises(ValueError):
+        WebhookService.verify_webhook_signature(payload, signature)
+
+
+def test_verify_webhook_signature_stale_timestamp(monkeypatch):
+    """Test webhook signature verification outside the replay window"""
+    import time
+    monkeypatch.setattr(
+        "app.services.webhook_service.settings.STRIPE_WEBHOOK_SECRET",
+        "whsec_test"
+    )
+    payload = b'{"type": "test.event"}'
+    signature = _sign(payload, "whsec_test", timestamp=int(time.time()) - 3600)
+
+    with pytest.raises(ValueError):
+        WebhookService.verify_webhook_signature(payload, signature)
+
+
+def test_verify_webhook_signature_invalid_payload(monkeypatch):
+    """Test webhook signature verification with invalid payload"""
+    monkeypatch.setattr(
+        "app.services.webhook_service.settings.STRIPE_WEBHOOK_SECRET",
+        "whsec_test"
+    )
+    payload = b'invalid json'
+    signature = _sign(payload, "whsec_test")
+
+    with pytest.raises(ValueError):
+        WebhookService.verify_webhook_signature(payload, signature)
+
+
 @pytest.mark.asyncio
 class TestWebhookService:
     """Test suite for WebhookService"""
     
-    def test_verify_webhook_signature_success(self):
-        """Test successful webhook signature verification"""
-        payload = b'{"type": "test.event"}'
-        signature = "test_signature"
-        
-        with patch("app.services.webhook_service.stripe.Webhook.construct_event") as mock_construct:
-            mock_event = {"type": "test.event", "id": "evt_test123"}
-            mock_construct.return_value = mock_event
-            
-            result = WebhookService.verify_webhook_signature(payload, signature)
-            
-            assert result == mock_event
-            mock_construct.assert_called_once()
-    
-    def test_verify_webhook_signature_invalid(self):
-        """Test webhook signature verification with invalid signature"""
-        payload = b'{"type": "test.event"}'
-        signature = "invalid_signature"
-        
-        with patch("app.services.webhook_service.stripe.Webhook.construct_event") as mock_construct:
-            mock_construct.side_effect = stripe.error.SignatureVerificationError(
-                "Invalid signature", signature
-            )
-            
-            with pytest.raises(ValueError):
-                WebhookService.verify_webhook_signature(payload, signature)
-    
-    def test_verify_webhook_signature_invalid_payload(self):
-        """Test webhook signature verification with invalid payload"""
-        payload = b'invalid json'
-        signature = "test_signature"
-        
-        with patch("app.services.webhook_service.stripe.Webhook.construct_event") as mock_construct:
-            mock_construct.side_effect = ValueError("Invalid payload")
-            
-            with pytest.raises(ValueError):
-                WebhookService.verify_webhook_signature(payload, signature)
-    
     async def test_handle_checkout_completed(self, async_db_session):
         """Test handling checkout.session.completed event"""
         # Create user